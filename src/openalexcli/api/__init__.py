@@ -1,5 +1,6 @@
 """OpenAlex API client."""
 
+from openalexcli.api.cache import ResponseCache
 from openalexcli.api.client import OpenAlexAPI, APIError, RateLimitError
 
-__all__ = ["OpenAlexAPI", "APIError", "RateLimitError"]
+__all__ = ["OpenAlexAPI", "APIError", "RateLimitError", "ResponseCache"]
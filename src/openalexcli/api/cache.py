@@ -0,0 +1,201 @@
+"""On-disk cache for OpenAlex GET responses."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Successful bodies are cached, and so are 404s so invalid IDs aren't re-queried.
+# A cached 404 lasts for the full TTL; delete the cache directory to drop it.
+CACHEABLE_STATUSES = frozenset({200, 404})
+
+# Request extension that makes the cache transports pass a request straight
+# through, so streamed bodies are never buffered for storage
+SKIP_CACHE = "openalexcli.skip_cache"
+
+# List and search results change as works are indexed, so their entries
+# expire sooner than single-entity lookups
+DEFAULT_LIST_TTL = 3600
+
+# Expired entries are swept from the cache directory at most this often
+PRUNE_INTERVAL = 3600
+_PRUNE_MARKER = ".last-prune"
+
+
+def default_cache_dir() -> Path:
+    """Return the default cache directory (honors XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "openalexcli"
+
+
+class ResponseCache:
+    """File-backed cache of response statuses and bodies keyed by request URL."""
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        ttl: float = 86400,
+        list_ttl: float = DEFAULT_LIST_TTL,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory to store cached responses in
+            ttl: Seconds a cached response stays valid
+            list_ttl: Seconds a cached list or search response stays valid
+                (capped at `ttl`)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.ttl = ttl
+        self.list_ttl = list_ttl
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / digest
+
+    def _ttl_for(self, url: str) -> float:
+        """Return the TTL for `url`: shorter for list endpoints like `/works`."""
+        # Single entities live at /<kind>/<id>; anything shallower is a list
+        if httpx.URL(url).path.strip("/").count("/") == 0:
+            return min(self.ttl, self.list_ttl)
+        return self.ttl
+
+    def get(self, url: str) -> tuple[int, bytes] | None:
+        """Return the cached (status, body) for `url`, or None if missing or expired.
+
+        Expired entries are deleted when found.
+        """
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self._ttl_for(url):
+                path.unlink()
+                return None
+            data = path.read_bytes()
+        except OSError:
+            return None
+        # Entries are stored as "<status>\n<body>"
+        status, _, content = data.partition(b"\n")
+        if not status.isdigit():
+            return None
+        return int(status), content
+
+    def set(self, url: str, content: bytes, status_code: int = 200) -> None:
+        """Store a response status and body for `url`."""
+        path = self._path(url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent readers never see partial files
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(b"%d\n" % status_code + content)
+            tmp_path.replace(path)
+        except OSError:
+            # Caching is best-effort; never fail the request because of it
+            pass
+        self._maybe_prune()
+
+    def _maybe_prune(self) -> None:
+        """Prune expired entries if the last sweep is over PRUNE_INTERVAL old."""
+        marker = self.cache_dir / _PRUNE_MARKER
+        try:
+            if time.time() - marker.stat().st_mtime < PRUNE_INTERVAL:
+                return
+        except OSError:
+            pass  # No sweep yet
+        try:
+            marker.touch()
+        except OSError:
+            return
+        self.prune()
+
+    def prune(self) -> int:
+        """Delete every entry older than `ttl`, returning how many were removed.
+
+        Leftover temporary files from interrupted writes are removed too.
+        """
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for path in self.cache_dir.glob("*/*"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+def _cached_response(cache: ResponseCache, request: httpx.Request) -> httpx.Response | None:
+    """Build a response from the cache for a GET request, if one is stored."""
+    if request.method != "GET" or request.extensions.get(SKIP_CACHE):
+        return None
+    cached = cache.get(str(request.url))
+    if cached is None:
+        logger.debug("X-Cache: MISS %s", request.url)
+        return None
+    logger.debug("X-Cache: HIT %s", request.url)
+    status_code, content = cached
+    return httpx.Response(
+        status_code,
+        content=content,
+        headers={"Content-Type": "application/json", "X-Cache": "HIT"},
+        request=request,
+    )
+
+
+def _should_store(request: httpx.Request, response: httpx.Response) -> bool:
+    """Return whether a network response should be written to the cache."""
+    return (
+        request.method == "GET"
+        and not request.extensions.get(SKIP_CACHE)
+        and response.status_code in CACHEABLE_STATUSES
+    )
+
+
+class CacheTransport(httpx.BaseTransport):
+    """httpx transport that serves GETs from a ResponseCache when possible."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        cached = _cached_response(self.cache, request)
+        if cached is not None:
+            return cached
+        response = self.transport.handle_request(request)
+        if _should_store(request, response):
+            response.read()
+            self.cache.set(str(request.url), response.content, response.status_code)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCacheTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of CacheTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: ResponseCache):
+        self.transport = transport
+        self.cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        cached = _cached_response(self.cache, request)
+        if cached is not None:
+            return cached
+        response = await self.transport.handle_async_request(request)
+        if _should_store(request, response):
+            await response.aread()
+            self.cache.set(str(request.url), response.content, response.status_code)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
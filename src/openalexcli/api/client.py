@@ -2,19 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
 import random
 import sys
 import time
-from datetime import datetime
-from typing import Any, Callable
-from urllib.parse import quote, urlencode
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator, NamedTuple, TypeVar
 
 import httpx
 
+from openalexcli.api.cache import (
+    SKIP_CACHE,
+    AsyncCacheTransport,
+    CacheTransport,
+    ResponseCache,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is an optional dependency
+    ijson = None
+
+T = TypeVar("T")
+
 
 class APIError(Exception):
     """Base exception for API errors."""
 
+    __slots__ = ("message", "status_code", "suggestion")
+
     def __init__(
         self,
         message: str,
@@ -28,18 +51,33 @@ class APIError(Exception):
 
     def to_dict(self) -> dict[str, Any]:
         """Convert error to dictionary for JSON output."""
-        result: dict[str, Any] = {"error": self.message}
-        if self.status_code:
-            result["status_code"] = self.status_code
-        if self.suggestion:
-            result["suggestion"] = self.suggestion
-        result["documentation"] = "https://docs.openalex.org/"
-        return result
+        return {
+            key: value
+            for key, value in (
+                ("error", self.message),
+                ("status_code", self.status_code),
+                ("suggestion", self.suggestion),
+                ("documentation", "https://docs.openalex.org/"),
+            )
+            if value is not None
+        }
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slot values aren't in __dict__, so pass them explicitly as state;
+        # BaseException.__setstate__ restores them with setattr
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in cls.__dict__.get("__slots__", ())
+        }
+        return (type(self).__new__, (type(self), *self.args), state)
 
 
 class RateLimitError(APIError):
     """Rate limit exceeded error."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(self, retry_after: int | None = None):
         super().__init__(
             message="Rate limit exceeded",
@@ -49,6 +87,52 @@ class RateLimitError(APIError):
         self.retry_after = retry_after
 
 
+_SCALAR_EVENTS = frozenset({"null", "boolean", "integer", "double", "number", "string"})
+
+
+def _parse_results(
+    chunks: Iterator[bytes],
+    meta: dict[str, Any],
+) -> Iterator[dict[str, Any]]:
+    """Yield items of a list response's `results` array from raw body chunks.
+
+    Top-level `meta` fields are copied into `meta` as they are seen. Falls
+    back to decoding the whole body when ijson is not installed.
+    """
+    if ijson is None:
+        body = b"".join(chunks)
+        page = orjson.loads(body) if orjson is not None else json.loads(body)
+        meta.update(page.get("meta") or {})
+        yield from page.get("results") or []
+        return
+
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events, use_float=True)
+    builder: Any = None
+    for chunk in chunks:
+        parser.send(chunk)
+        for prefix, event, value in events:
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == "results.item" and event == "end_map":
+                    yield builder.value
+                    builder = None
+            elif prefix == "results.item" and event == "start_map":
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif (
+                event in _SCALAR_EVENTS
+                and prefix.startswith("meta.")
+                and prefix.count(".") == 1
+            ):
+                meta[prefix[5:]] = value
+        del events[:]
+    parser.close()
+
+
+# Prefix of full OpenAlex entity IDs
+OPENALEX_URL = "https://openalex.org/"
+
 # Default fields to request for each entity type
 DEFAULT_WORK_FIELDS = [
     "id",
@@ -113,6 +197,51 @@ BIBTEX_WORK_FIELDS = [
 ]
 
 
+# Precomputed "select" values for the defaults above
+DEFAULT_WORK_FIELDS_CSV = ",".join(DEFAULT_WORK_FIELDS)
+DEFAULT_AUTHOR_FIELDS_CSV = ",".join(DEFAULT_AUTHOR_FIELDS)
+DEFAULT_INSTITUTION_FIELDS_CSV = ",".join(DEFAULT_INSTITUTION_FIELDS)
+DEFAULT_SOURCE_FIELDS_CSV = ",".join(DEFAULT_SOURCE_FIELDS)
+
+
+class _Entity(NamedTuple):
+    """Endpoint metadata for one OpenAlex entity type."""
+
+    path: str
+    prefix: str
+    default_select: str
+    # Filter key selecting this entity's works (None for works themselves)
+    works_filter: str | None
+
+
+_ENTITIES = {
+    "work": _Entity("/works", "W", DEFAULT_WORK_FIELDS_CSV, None),
+    "author": _Entity(
+        "/authors", "A", DEFAULT_AUTHOR_FIELDS_CSV, "authorships.author.id"
+    ),
+    "institution": _Entity(
+        "/institutions",
+        "I",
+        DEFAULT_INSTITUTION_FIELDS_CSV,
+        "authorships.institutions.id",
+    ),
+    "source": _Entity(
+        "/sources", "S", DEFAULT_SOURCE_FIELDS_CSV, "primary_location.source.id"
+    ),
+}
+
+# Maximum number of values OpenAlex accepts in one OR filter
+MAX_FILTER_VALUES = 50
+
+# Page-number paging only reaches this many results; beyond it use cursors
+MAX_PAGED_RESULTS = 10_000
+
+# Sort values accepted by the API together with group_by
+GROUP_BY_SORTS = frozenset(
+    {"key", "count", "count:desc", "count:asc", "key:desc", "key:asc"}
+)
+
+
 class OpenAlexAPI:
     """Client for the OpenAlex API."""
 
@@ -124,6 +253,9 @@ class OpenAlexAPI:
         max_retries: int = 3,
         max_retry_wait: int = 60,
         status_callback: Callable[[str], None] | None = None,
+        max_connections: int = 100,
+        cache_dir: str | Path | None = None,
+        cache_ttl: float = 86400,
     ):
         """
         Initialize the OpenAlex API client.
@@ -133,126 +265,329 @@ class OpenAlexAPI:
             max_retries: Maximum number of retries for rate-limited requests
             max_retry_wait: Maximum wait time between retries in seconds
             status_callback: Optional callback for status messages
+            max_connections: Size of the HTTP connection pool
+            cache_dir: Directory for caching GET responses (None disables caching)
+            cache_ttl: Seconds a cached response stays valid
         """
         self.email = email
         self.max_retries = max_retries
         self.max_retry_wait = max_retry_wait
         self.status_callback = status_callback
+        self.max_connections = max_connections
+        self.cache = ResponseCache(cache_dir, cache_ttl) if cache_dir else None
         self._client: httpx.Client | None = None
+        self._aclient: httpx.AsyncClient | None = None
+        self._short_ids: dict[tuple[str, str], str] = {}
+        self.refresh_tty()
+
+    def refresh_tty(self) -> None:
+        """Re-check whether stderr is a terminal (e.g. after redirecting it)."""
+        self._stderr_is_tty = sys.stderr.isatty()
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments shared by the sync and async HTTP clients."""
+        headers = {
+            "User-Agent": "openalexcli/0.1.0 (https://github.com/mrshu/openalexcli)",
+            # Decoders for br/zstd come from the httpx extras we depend on
+            "Accept-Encoding": "gzip, br, zstd",
+        }
+        if self.email:
+            headers["mailto"] = self.email
+        return {
+            "base_url": self.BASE_URL,
+            "headers": headers,
+            "timeout": 30.0,
+        }
+
+    def _add_mailto(self, request: httpx.Request) -> None:
+        """Request hook adding the polite-pool email to outbound requests."""
+        if self.email and "mailto" not in request.url.params:
+            request.url = request.url.copy_merge_params({"mailto": self.email})
+
+    async def _aadd_mailto(self, request: httpx.Request) -> None:
+        """Async request hook adding the polite-pool email."""
+        self._add_mailto(request)
+
+    def _transport_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments shared by the sync and async HTTP transports."""
+        return {
+            # Keep connections alive and multiplex them over HTTP/2 so bursts
+            # of requests to api.openalex.org don't queue or re-handshake
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            "http2": True,
+        }
 
     @property
     def client(self) -> httpx.Client:
         """Lazy initialization of HTTP client."""
         if self._client is None:
-            headers = {
-                "User-Agent": "openalexcli/0.1.0 (https://github.com/mrshu/openalexcli)",
-            }
-            if self.email:
-                headers["mailto"] = self.email
+            transport: httpx.BaseTransport = httpx.HTTPTransport(
+                **self._transport_kwargs()
+            )
+            if self.cache is not None:
+                transport = CacheTransport(transport, self.cache)
             self._client = httpx.Client(
-                base_url=self.BASE_URL,
-                headers=headers,
-                timeout=30.0,
+                **self._client_kwargs(),
+                transport=transport,
+                event_hooks={"request": [self._add_mailto]},
             )
         return self._client
 
+    @property
+    def aclient(self) -> httpx.AsyncClient:
+        """Lazy initialization of async HTTP client."""
+        if self._aclient is None:
+            transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+                **self._transport_kwargs()
+            )
+            if self.cache is not None:
+                transport = AsyncCacheTransport(transport, self.cache)
+            self._aclient = httpx.AsyncClient(
+                **self._client_kwargs(),
+                transport=transport,
+                event_hooks={"request": [self._aadd_mailto]},
+            )
+        return self._aclient
+
     def __enter__(self) -> "OpenAlexAPI":
         return self
 
     def __exit__(self, *args: Any) -> None:
         self.close()
 
+    async def __aenter__(self) -> "OpenAlexAPI":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+        self.close()
+
     def close(self) -> None:
         """Close the HTTP client."""
         if self._client is not None:
             self._client.close()
             self._client = None
 
+    async def aclose(self) -> None:
+        """Close the async HTTP client."""
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
     def _report_status(self, message: str) -> None:
         """Report status via callback or stderr."""
         if self.status_callback:
             self.status_callback(message)
-        elif sys.stderr.isatty():
+        elif self._stderr_is_tty:
             print(message, file=sys.stderr)
 
-    def _request(
+    def _rate_limit_wait(
+        self,
+        response: httpx.Response,
+        attempt: int,
+        prev_wait: float,
+    ) -> float:
+        """Compute how long to wait before retrying a rate-limited request.
+
+        Honors Retry-After when present, otherwise uses decorrelated jitter
+        based on the previous wait. Raises RateLimitError once retries are
+        exhausted.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if attempt >= self.max_retries:
+            raise RateLimitError(retry_after=int(retry_after) if retry_after else None)
+
+        if retry_after:
+            wait_time = float(retry_after)
+        else:
+            wait_time = min(self.max_retry_wait, random.uniform(1.0, prev_wait * 3))
+
+        if self.status_callback or self._stderr_is_tty:
+            resume_str = time.strftime(
+                "%H:%M:%S", time.localtime(time.time() + wait_time)
+            )
+            self._report_status(
+                f"Rate limited. Retry {attempt + 1}/{self.max_retries} "
+                f"in {wait_time:.1f}s (at {resume_str})..."
+            )
+        return wait_time
+
+    def _connection_error_wait(self, error: httpx.RequestError, attempt: int) -> int:
+        """Compute how long to wait before retrying after a connection error.
+
+        Raises APIError once retries are exhausted.
+        """
+        if attempt >= self.max_retries:
+            raise APIError(
+                message=f"Connection error: {error}",
+                suggestion="Check your network connection",
+            ) from error
+
+        wait_time = min(2**attempt, self.max_retry_wait)
+        self._report_status(
+            f"Connection error. Retry {attempt + 1}/{self.max_retries} "
+            f"in {wait_time}s..."
+        )
+        return wait_time
+
+    @staticmethod
+    def _decode_json(response: httpx.Response) -> Any:
+        """Decode a JSON response body, using orjson when available."""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
+        """Return the decoded body of a successful response or raise APIError."""
+        if response.status_code == 200:
+            return self._decode_json(response)
+
+        if response.status_code == 404:
+            raise APIError(
+                message="Entity not found",
+                status_code=404,
+                suggestion="Check the ID format. OpenAlex IDs start with W (works), A (authors), I (institutions), S (sources), etc.",
+            )
+
+        if response.status_code == 400:
+            try:
+                error_data = self._decode_json(response)
+                message = error_data.get("message", "Bad request")
+            except Exception:
+                message = "Bad request"
+            raise APIError(
+                message=message,
+                status_code=400,
+                suggestion="Check the query parameters and filter syntax",
+            )
+
+        raise APIError(
+            message=f"API request failed: {response.status_code}",
+            status_code=response.status_code,
+        )
+
+    def _send(
         self,
         method: str,
         path: str,
         params: dict[str, Any] | None = None,
-    ) -> dict[str, Any]:
-        """Make an HTTP request with retry logic."""
-        last_error: Exception | None = None
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request, retrying on rate limits and connection errors.
+
+        Returns the first response that isn't a 429. With `stream=True` the
+        body is left unread and the caller must close the response; such
+        requests bypass the response cache, which would have to buffer them.
+        """
+        # Encode the URL once and reuse it across retries
+        extensions = {SKIP_CACHE: True} if stream else None
+        request = self.client.build_request(
+            method, path, params=params, extensions=extensions
+        )
+
+        # Fast path: most requests succeed on the first attempt
+        try:
+            response = self.client.send(request, stream=stream)
+        except httpx.RequestError as e:
+            return self._send_with_retries(request, stream, None, e)
+        if response.status_code != 429:
+            return response
+        return self._send_with_retries(request, stream, response, None)
+
+    def _send_with_retries(
+        self,
+        request: httpx.Request,
+        stream: bool,
+        response: httpx.Response | None,
+        error: httpx.RequestError | None,
+    ) -> httpx.Response:
+        """Retry loop for `_send`, given the outcome of the first attempt.
+
+        Exactly one of `response` and `error` is set on entry.
+        """
+        prev_wait = 1.0
 
         for attempt in range(self.max_retries + 1):
-            try:
-                response = self.client.request(method, path, params=params)
+            if attempt > 0:
+                try:
+                    response, error = self.client.send(request, stream=stream), None
+                except httpx.RequestError as e:
+                    response, error = None, e
 
-                if response.status_code == 200:
-                    return response.json()
+            if error is not None:
+                time.sleep(self._connection_error_wait(error, attempt))
+                continue
 
-                if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    wait_time = (
-                        int(retry_after)
-                        if retry_after
-                        else min(2**attempt, self.max_retry_wait)
-                    )
-                    # Add jitter (±25%)
-                    wait_time = int(wait_time * (0.75 + random.random() * 0.5))
-
-                    if attempt < self.max_retries:
-                        resume_time = datetime.now().timestamp() + wait_time
-                        resume_str = datetime.fromtimestamp(resume_time).strftime(
-                            "%H:%M:%S"
-                        )
-                        self._report_status(
-                            f"Rate limited. Retry {attempt + 1}/{self.max_retries} "
-                            f"in {wait_time}s (at {resume_str})..."
-                        )
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        raise RateLimitError(retry_after=int(retry_after) if retry_after else None)
-
-                if response.status_code == 404:
-                    raise APIError(
-                        message="Entity not found",
-                        status_code=404,
-                        suggestion="Check the ID format. OpenAlex IDs start with W (works), A (authors), I (institutions), S (sources), etc.",
-                    )
+            if response.status_code == 429:
+                response.close()
+                prev_wait = self._rate_limit_wait(response, attempt, prev_wait)
+                time.sleep(prev_wait)
+                continue
 
-                if response.status_code == 400:
-                    try:
-                        error_data = response.json()
-                        message = error_data.get("message", "Bad request")
-                    except Exception:
-                        message = "Bad request"
-                    raise APIError(
-                        message=message,
-                        status_code=400,
-                        suggestion="Check the query parameters and filter syntax",
-                    )
+            return response
 
-                raise APIError(
-                    message=f"API request failed: {response.status_code}",
-                    status_code=response.status_code,
-                )
+        raise APIError(
+            message=f"Request failed after {self.max_retries} retries",
+        ) from error
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make an HTTP request with retry logic."""
+        return self._handle_response(self._send(method, path, params))
+
+    def _stream_results(
+        self,
+        path: str,
+        params: dict[str, Any],
+        meta: dict[str, Any],
+    ) -> Iterator[dict[str, Any]]:
+        """GET a list endpoint and yield its results as they are parsed.
+
+        The page's `meta` object is copied into `meta` while parsing, so it
+        is complete once the iterator is exhausted.
+        """
+        response = self._send("GET", path, params, stream=True)
+        try:
+            if response.status_code != 200:
+                response.read()
+                self._handle_response(response)
+            yield from _parse_results(response.iter_bytes(), meta)
+        finally:
+            response.close()
+
+    async def _arequest(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make an async HTTP request with retry logic."""
+        last_error: Exception | None = None
+        prev_wait = 1.0
+        # Encode the URL once and reuse it across retries
+        request = self.aclient.build_request(method, path, params=params)
 
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self.aclient.send(request)
             except httpx.RequestError as e:
                 last_error = e
-                if attempt < self.max_retries:
-                    wait_time = min(2**attempt, self.max_retry_wait)
-                    self._report_status(
-                        f"Connection error. Retry {attempt + 1}/{self.max_retries} "
-                        f"in {wait_time}s..."
-                    )
-                    time.sleep(wait_time)
-                    continue
-                raise APIError(
-                    message=f"Connection error: {e}",
-                    suggestion="Check your network connection",
-                ) from e
+                await asyncio.sleep(self._connection_error_wait(e, attempt))
+                continue
+
+            if response.status_code == 429:
+                prev_wait = self._rate_limit_wait(response, attempt, prev_wait)
+                await asyncio.sleep(prev_wait)
+                continue
+
+            return self._handle_response(response)
 
         raise APIError(
             message=f"Request failed after {self.max_retries} retries",
@@ -265,11 +600,14 @@ class OpenAlexAPI:
         sort: str | None = None,
         page: int | None = None,
         per_page: int | None = None,
-        select: list[str] | None = None,
+        select: list[str] | str | None = None,
         group_by: str | None = None,
         extra_filters: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Build query parameters for API requests."""
+        """Build query parameters for API requests.
+
+        `select` may be a list of fields or an already comma-joined string.
+        """
         params: dict[str, Any] = {}
 
         # Build filter string
@@ -277,18 +615,19 @@ class OpenAlexAPI:
         if filter_str:
             filters.append(filter_str)
         if extra_filters:
-            for key, value in extra_filters.items():
-                if value is not None:
-                    filters.append(f"{key}:{value}")
+            filters.extend(
+                f"{key}:{value}" for key, value in extra_filters.items() if value is not None
+            )
         if filters:
             params["filter"] = ",".join(filters)
 
         if search:
-            params["search"] = search
+            # Collapse whitespace so equivalent queries share one cache entry
+            params["search"] = " ".join(search.split())
         if group_by:
             # group_by doesn't work with select; sort must be 'key' or 'count'
             params["group_by"] = group_by
-            if sort in ("key", "count", "count:desc", "count:asc", "key:desc", "key:asc"):
+            if sort in GROUP_BY_SORTS:
                 params["sort"] = sort
             else:
                 params["sort"] = "count:desc"
@@ -296,18 +635,359 @@ class OpenAlexAPI:
             if sort:
                 params["sort"] = sort
             if select:
-                params["select"] = ",".join(select)
+                params["select"] = select if isinstance(select, str) else ",".join(select)
         if page:
             params["page"] = page
         if per_page:
             params["per_page"] = per_page
 
-        # Add email for polite pool if available
-        if self.email:
-            params["mailto"] = self.email
-
         return params
 
+    def _resolve_short_id(self, kind: str, raw_id: str) -> str:
+        """Resolve an entity ID (DOI, ORCID, ROR, ...) to a short OpenAlex ID.
+
+        Non-OpenAlex IDs need an extra lookup; results are cached per client
+        so paginating e.g. the citations of a DOI only resolves it once.
+        """
+        key = (kind, raw_id)
+        if key in self._short_ids:
+            return self._short_ids[key]
+
+        short_id = self._normalize_id(kind, raw_id)
+        if not short_id.startswith(_ENTITIES[kind].prefix):
+            entity = self._get_entity(kind, short_id, select=["id"])
+            short_id = entity["id"].removeprefix(OPENALEX_URL)
+
+        self._short_ids[key] = short_id
+        return short_id
+
+    def iter_all(
+        self,
+        path: str,
+        params: dict[str, Any],
+        per_page: int = 200,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every page of a list endpoint using cursor paging.
+
+        Yields each raw page response. Cursor paging avoids OpenAlex's
+        deep-paging limits, and `per_page` defaults to the API maximum.
+        """
+        params = {k: v for k, v in params.items() if k != "page"}
+        params["per_page"] = per_page
+        params["cursor"] = "*"
+        yield from self._follow_cursor(path, params, self._request("GET", path, params))
+
+    def _follow_cursor(
+        self,
+        path: str,
+        params: dict[str, Any],
+        response: dict[str, Any],
+    ) -> Iterator[dict[str, Any]]:
+        """Yield `response`, then each later cursor page it leads to.
+
+        `params` is updated in place with the cursor of each next page.
+        """
+        while True:
+            yield response
+            next_cursor = (response.get("meta") or {}).get("next_cursor")
+            if not next_cursor or not response.get("results"):
+                return
+            params["cursor"] = next_cursor
+            response = self._request("GET", path, params)
+
+    def iter_results(
+        self,
+        path: str,
+        params: dict[str, Any],
+        per_page: int = 200,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every result of a list endpoint using cursor paging.
+
+        Unlike `iter_all`, yields individual entities and parses each page
+        incrementally (with ijson installed), so a full page is never held
+        in memory as raw bytes and Python objects at once.
+        """
+        params = {k: v for k, v in params.items() if k != "page"}
+        params["per_page"] = per_page
+        params["cursor"] = "*"
+
+        while True:
+            meta: dict[str, Any] = {}
+            count = 0
+            for result in self._stream_results(path, params, meta):
+                count += 1
+                yield result
+            next_cursor = meta.get("next_cursor")
+            if not next_cursor or not count:
+                return
+            params["cursor"] = next_cursor
+
+    def get_all_pages(
+        self,
+        path: str,
+        params: dict[str, Any],
+        per_page: int = 200,
+        concurrency: int = 8,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over every page of a list endpoint, requesting pages concurrently.
+
+        The first page is fetched with a cursor to learn the total count,
+        then the remaining pages are requested in parallel through the async
+        client and yielded in page order. Result sets beyond OpenAlex's
+        page-number limit keep following the first page's cursor instead,
+        one page at a time, so they are never held in memory at once. Calls
+        from inside a running event loop fetch pages one by one as well.
+        """
+        params = {k: v for k, v in params.items() if k not in ("page", "cursor")}
+        params["per_page"] = per_page
+
+        # A cursor request returns the same first page as page=1, plus the
+        # cursor needed to continue past the page-number limit
+        cursor_params = {**params, "cursor": "*"}
+        first = self._request("GET", path, cursor_params)
+        total = (first.get("meta") or {}).get("count") or 0
+        if total > MAX_PAGED_RESULTS:
+            yield from self._follow_cursor(path, cursor_params, first)
+            return
+        yield first
+
+        pages = range(2, -(-total // per_page) + 1)
+        if not pages:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            for p in pages:
+                yield self._request("GET", path, {**params, "page": p})
+            return
+
+        async def run() -> list[dict[str, Any]]:
+            try:
+                return await self.gather(
+                    [self._arequest("GET", path, {**params, "page": p}) for p in pages],
+                    concurrency=concurrency,
+                )
+            finally:
+                # The async client is bound to this loop; don't leak it
+                await self.aclose()
+
+        # At most MAX_PAGED_RESULTS results, so gathering them is bounded
+        yield from asyncio.run(run())
+
+    # -------------------------------------------------------------------------
+    # Shared entity helpers
+    # -------------------------------------------------------------------------
+
+    def _normalize_id(self, kind: str, entity_id: str) -> str:
+        """Normalize an ID using the normalizer for `kind`."""
+        return getattr(self, f"_normalize_{kind}_id")(entity_id)
+
+    def _get_entity(
+        self,
+        kind: str,
+        entity_id: str,
+        select: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Get a single entity of `kind` by ID."""
+        entity = _ENTITIES[kind]
+        normalized_id = self._normalize_id(kind, entity_id)
+        params = {"select": ",".join(select) if select else entity.default_select}
+        return self._request("GET", f"{entity.path}/{normalized_id}", params)
+
+    async def _aget_entity(
+        self,
+        kind: str,
+        entity_id: str,
+        select: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Get a single entity of `kind` by ID (async)."""
+        entity = _ENTITIES[kind]
+        normalized_id = self._normalize_id(kind, entity_id)
+        params = {"select": ",".join(select) if select else entity.default_select}
+        return await self._arequest("GET", f"{entity.path}/{normalized_id}", params)
+
+    def _search_entities(
+        self,
+        kind: str,
+        query: str,
+        filter_str: str | None = None,
+        sort: str | None = None,
+        page: int = 1,
+        per_page: int = 25,
+        select: list[str] | None = None,
+        group_by: str | None = None,
+    ) -> dict[str, Any]:
+        """Search entities of `kind`."""
+        entity = _ENTITIES[kind]
+        params = self._build_params(
+            filter_str=filter_str,
+            search=query,
+            sort=sort or "cited_by_count:desc",
+            page=page,
+            per_page=per_page,
+            select=select or entity.default_select,
+            group_by=group_by,
+        )
+        return self._request("GET", entity.path, params)
+
+    def _entity_works_params(
+        self,
+        kind: str,
+        entity_id: str,
+        filter_str: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        sort: str | None = None,
+        page: int | None = None,
+        per_page: int | None = None,
+        select: list[str] | None = None,
+        group_by: str | None = None,
+    ) -> dict[str, Any]:
+        """Build params for listing the works of an author, institution or source."""
+        normalized_id = self._resolve_short_id(kind, entity_id)
+
+        extra_filters: dict[str, Any] = {_ENTITIES[kind].works_filter: normalized_id}
+        if from_date:
+            extra_filters["from_publication_date"] = from_date
+        if to_date:
+            extra_filters["to_publication_date"] = to_date
+
+        return self._build_params(
+            filter_str=filter_str,
+            sort=sort or "publication_date:desc",
+            page=page,
+            per_page=per_page,
+            select=select or DEFAULT_WORK_FIELDS_CSV,
+            group_by=group_by,
+            extra_filters=extra_filters,
+        )
+
+    def _get_entities_by_ids(
+        self,
+        kind: str,
+        entity_ids: list[str],
+        select: list[str] | None = None,
+        concurrency: int = 8,
+    ) -> list[dict[str, Any] | None]:
+        """Get many entities of `kind`, batching IDs into OR filters.
+
+        OpenAlex IDs (and DOIs, for works) are fetched up to
+        MAX_FILTER_VALUES per request; other IDs are looked up individually,
+        `concurrency` at a time. Results follow the order of `entity_ids`,
+        with None for IDs that match nothing.
+        """
+        entity = _ENTITIES[kind]
+        fields = list(select) if select else entity.default_select.split(",")
+        # Needed to match results back to the requested IDs
+        for field in ("id", "doi") if kind == "work" else ("id",):
+            if field not in fields:
+                fields.append(field)
+
+        normalized_ids = [self._normalize_id(kind, i) for i in entity_ids]
+        batches = {
+            "openalex": [i for i in normalized_ids if i.startswith(entity.prefix)],
+        }
+        if kind == "work":
+            batches["doi"] = [
+                i.removeprefix("doi:") for i in normalized_ids if i.startswith("doi:")
+            ]
+
+        found: dict[str, dict[str, Any] | None] = {}
+        for filter_key, values in batches.items():
+            values = list(dict.fromkeys(values))
+            for start in range(0, len(values), MAX_FILTER_VALUES):
+                chunk = values[start : start + MAX_FILTER_VALUES]
+                params = self._build_params(
+                    filter_str=f"{filter_key}:{'|'.join(chunk)}",
+                    per_page=len(chunk),
+                    select=fields,
+                )
+                for result in self._request("GET", entity.path, params).get("results", []):
+                    found[result["id"].removeprefix(OPENALEX_URL)] = result
+                    if result.get("doi"):
+                        doi = result["doi"].removeprefix("https://doi.org/").lower()
+                        found[f"doi:{doi}"] = result
+
+        # IDs that can't go in a filter (PMIDs, MAG IDs, ...)
+        singles = list(
+            dict.fromkeys(
+                i
+                for i in normalized_ids
+                if not (i.startswith(entity.prefix) or i.startswith("doi:"))
+            )
+        )
+        if singles:
+            looked_up = self._get_entities_bulk(
+                kind, singles, select, concurrency, skip_missing=True
+            )
+            found.update(zip(singles, looked_up))
+
+        return [
+            found.get(i.lower() if i.startswith("doi:") else i) for i in normalized_ids
+        ]
+
+    async def _aget_entity_or_none(
+        self,
+        kind: str,
+        entity_id: str,
+        select: list[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Get a single entity of `kind` by ID (async), or None if not found."""
+        try:
+            return await self._aget_entity(kind, entity_id, select)
+        except APIError as e:
+            if e.status_code != 404:
+                raise
+            return None
+
+    def _get_entities_bulk(
+        self,
+        kind: str,
+        entity_ids: list[str],
+        select: list[str] | None = None,
+        concurrency: int = 16,
+        skip_missing: bool = False,
+    ) -> list[dict[str, Any] | None]:
+        """Fetch several entities of `kind`, concurrently when possible.
+
+        Runs the async client in a private event loop. A single ID, or a
+        call from inside a running event loop, is fetched sequentially.
+        With `skip_missing`, IDs that 404 give None instead of raising.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            in_loop = False
+        else:
+            in_loop = True
+
+        if len(entity_ids) > 1 and not in_loop:
+            fetch = self._aget_entity_or_none if skip_missing else self._aget_entity
+
+            async def run() -> list[dict[str, Any] | None]:
+                try:
+                    return await self.gather(
+                        [fetch(kind, i, select) for i in entity_ids],
+                        concurrency=concurrency,
+                    )
+                finally:
+                    # The async client is bound to this loop; don't leak it
+                    await self.aclose()
+
+            return asyncio.run(run())
+
+        results: list[dict[str, Any] | None] = []
+        for entity_id in entity_ids:
+            try:
+                results.append(self._get_entity(kind, entity_id, select))
+            except APIError as e:
+                if not skip_missing or e.status_code != 404:
+                    raise
+                results.append(None)
+        return results
+
     # -------------------------------------------------------------------------
     # Works endpoints
     # -------------------------------------------------------------------------
@@ -318,13 +998,24 @@ class OpenAlexAPI:
         select: list[str] | None = None,
     ) -> dict[str, Any]:
         """Get a single work by ID."""
-        # Normalize ID (handle DOI, PMID, etc.)
-        normalized_id = self._normalize_work_id(work_id)
-        fields = select or DEFAULT_WORK_FIELDS
-        params = {"select": ",".join(fields)}
-        if self.email:
-            params["mailto"] = self.email
-        return self._request("GET", f"/works/{normalized_id}", params)
+        return self._get_entity("work", work_id, select)
+
+    def get_works_by_ids(
+        self,
+        work_ids: list[str],
+        select: list[str] | None = None,
+        keep_missing: bool = False,
+        concurrency: int = 8,
+    ) -> list[dict[str, Any] | None]:
+        """Get several works by ID with as few requests as possible.
+
+        IDs that match nothing are skipped, or give None with `keep_missing`
+        so the results line up with `work_ids`.
+        """
+        results = self._get_entities_by_ids("work", work_ids, select, concurrency)
+        if keep_missing:
+            return results
+        return [r for r in results if r is not None]
 
     def search_works(
         self,
@@ -342,6 +1033,54 @@ class OpenAlexAPI:
         group_by: str | None = None,
     ) -> dict[str, Any]:
         """Search for works."""
+        params = self._build_params(
+            filter_str=filter_str,
+            search=query,
+            sort=sort or "cited_by_count:desc",
+            page=page,
+            per_page=per_page,
+            select=select or DEFAULT_WORK_FIELDS_CSV,
+            group_by=group_by,
+            extra_filters=self._work_filters(
+                from_date, to_date, min_citations, open_access, work_type
+            ),
+        )
+        return self._request("GET", "/works", params)
+
+    def iter_works(
+        self,
+        query: str | None = None,
+        filter_str: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        min_citations: int | None = None,
+        open_access: bool | None = None,
+        work_type: str | None = None,
+        sort: str | None = None,
+        per_page: int = 200,
+        select: list[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all pages of a works search using cursor paging."""
+        params = self._build_params(
+            filter_str=filter_str,
+            search=query,
+            sort=sort or "cited_by_count:desc",
+            select=select or DEFAULT_WORK_FIELDS_CSV,
+            extra_filters=self._work_filters(
+                from_date, to_date, min_citations, open_access, work_type
+            ),
+        )
+        return self.iter_all("/works", params, per_page=per_page)
+
+    @staticmethod
+    def _work_filters(
+        from_date: str | None = None,
+        to_date: str | None = None,
+        min_citations: int | None = None,
+        open_access: bool | None = None,
+        work_type: str | None = None,
+    ) -> dict[str, Any]:
+        """Build the extra filters shared by the works search methods."""
         extra_filters: dict[str, Any] = {}
         if from_date:
             extra_filters["from_publication_date"] = from_date
@@ -353,18 +1092,7 @@ class OpenAlexAPI:
             extra_filters["is_oa"] = "true"
         if work_type:
             extra_filters["type"] = work_type
-
-        params = self._build_params(
-            filter_str=filter_str,
-            search=query,
-            sort=sort or "cited_by_count:desc",
-            page=page,
-            per_page=per_page,
-            select=select or DEFAULT_WORK_FIELDS,
-            group_by=group_by,
-            extra_filters=extra_filters,
-        )
-        return self._request("GET", "/works", params)
+        return extra_filters
 
     def get_citations(
         self,
@@ -374,18 +1102,14 @@ class OpenAlexAPI:
         select: list[str] | None = None,
     ) -> dict[str, Any]:
         """Get works that cite a given work."""
-        normalized_id = self._normalize_work_id(work_id)
-        # Get the full OpenAlex ID first if needed
-        if not normalized_id.startswith("W"):
-            work = self.get_work(normalized_id, select=["id"])
-            normalized_id = work["id"].replace("https://openalex.org/", "")
+        normalized_id = self._resolve_short_id("work", work_id)
 
         params = self._build_params(
             filter_str=f"cites:{normalized_id}",
             sort="cited_by_count:desc",
             page=page,
             per_page=per_page,
-            select=select or DEFAULT_WORK_FIELDS,
+            select=select or DEFAULT_WORK_FIELDS_CSV,
         )
         return self._request("GET", "/works", params)
 
@@ -397,39 +1121,35 @@ class OpenAlexAPI:
         select: list[str] | None = None,
     ) -> dict[str, Any]:
         """Get works cited by a given work."""
-        normalized_id = self._normalize_work_id(work_id)
-        # Get the full OpenAlex ID first if needed
-        if not normalized_id.startswith("W"):
-            work = self.get_work(normalized_id, select=["id"])
-            normalized_id = work["id"].replace("https://openalex.org/", "")
+        normalized_id = self._resolve_short_id("work", work_id)
 
         params = self._build_params(
             filter_str=f"cited_by:{normalized_id}",
             sort="cited_by_count:desc",
             page=page,
             per_page=per_page,
-            select=select or DEFAULT_WORK_FIELDS,
+            select=select or DEFAULT_WORK_FIELDS_CSV,
         )
         return self._request("GET", "/works", params)
 
-    def _normalize_work_id(self, work_id: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _normalize_work_id(work_id: str) -> str:
         """Normalize work ID to OpenAlex format."""
-        # Already an OpenAlex ID
-        if work_id.startswith("W") or work_id.startswith("https://openalex.org/"):
-            return work_id.replace("https://openalex.org/", "")
+        # Already an OpenAlex ID (or URL)
+        short_id = work_id.removeprefix(OPENALEX_URL)
+        if short_id[:1] == "W" or len(short_id) != len(work_id):
+            return short_id
 
         # DOI
-        if work_id.startswith("10.") or work_id.startswith("doi:"):
-            doi = work_id.replace("doi:", "").replace("https://doi.org/", "")
+        if work_id.startswith(("10.", "doi:")):
+            doi = work_id.removeprefix("doi:").removeprefix("https://doi.org/")
             return f"doi:{doi}"
 
-        # PMID
-        if work_id.lower().startswith("pmid:"):
-            return work_id.lower()
-
-        # MAG ID
-        if work_id.lower().startswith("mag:"):
-            return work_id.lower()
+        # PMID / MAG ID
+        lowered = work_id.lower()
+        if lowered.startswith(("pmid:", "mag:")):
+            return lowered
 
         # OpenAlex URL
         if "openalex.org" in work_id:
@@ -447,12 +1167,16 @@ class OpenAlexAPI:
         select: list[str] | None = None,
     ) -> dict[str, Any]:
         """Get a single author by ID."""
-        normalized_id = self._normalize_author_id(author_id)
-        fields = select or DEFAULT_AUTHOR_FIELDS
-        params = {"select": ",".join(fields)}
-        if self.email:
-            params["mailto"] = self.email
-        return self._request("GET", f"/authors/{normalized_id}", params)
+        return self._get_entity("author", author_id, select)
+
+    def get_authors_by_ids(
+        self,
+        author_ids: list[str],
+        select: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get several authors by ID with as few requests as possible."""
+        results = self._get_entities_by_ids("author", author_ids, select)
+        return [r for r in results if r is not None]
 
     def search_authors(
         self,
@@ -465,16 +1189,9 @@ class OpenAlexAPI:
         group_by: str | None = None,
     ) -> dict[str, Any]:
         """Search for authors."""
-        params = self._build_params(
-            filter_str=filter_str,
-            search=query,
-            sort=sort or "cited_by_count:desc",
-            page=page,
-            per_page=per_page,
-            select=select or DEFAULT_AUTHOR_FIELDS,
-            group_by=group_by,
+        return self._search_entities(
+            "author", query, filter_str, sort, page, per_page, select, group_by
         )
-        return self._request("GET", "/authors", params)
 
     def get_author_works(
         self,
@@ -489,38 +1206,54 @@ class OpenAlexAPI:
         group_by: str | None = None,
     ) -> dict[str, Any]:
         """Get works by an author."""
-        normalized_id = self._normalize_author_id(author_id)
-        # Get full OpenAlex ID if needed
-        if not normalized_id.startswith("A"):
-            author = self.get_author(normalized_id, select=["id"])
-            normalized_id = author["id"].replace("https://openalex.org/", "")
-
-        extra_filters: dict[str, Any] = {"authorships.author.id": normalized_id}
-        if from_date:
-            extra_filters["from_publication_date"] = from_date
-        if to_date:
-            extra_filters["to_publication_date"] = to_date
-
-        params = self._build_params(
+        params = self._entity_works_params(
+            "author",
+            author_id,
             filter_str=filter_str,
-            sort=sort or "publication_date:desc",
+            from_date=from_date,
+            to_date=to_date,
+            sort=sort,
             page=page,
             per_page=per_page,
-            select=select or DEFAULT_WORK_FIELDS,
+            select=select,
             group_by=group_by,
-            extra_filters=extra_filters,
         )
         return self._request("GET", "/works", params)
 
-    def _normalize_author_id(self, author_id: str) -> str:
+    def iter_author_works(
+        self,
+        author_id: str,
+        filter_str: str | None = None,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        sort: str | None = None,
+        per_page: int = 200,
+        select: list[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over all pages of an author's works using cursor paging."""
+        params = self._entity_works_params(
+            "author",
+            author_id,
+            filter_str=filter_str,
+            from_date=from_date,
+            to_date=to_date,
+            sort=sort,
+            select=select,
+        )
+        return self.iter_all("/works", params, per_page=per_page)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _normalize_author_id(author_id: str) -> str:
         """Normalize author ID to OpenAlex format."""
-        # Already an OpenAlex ID
-        if author_id.startswith("A") or author_id.startswith("https://openalex.org/"):
-            return author_id.replace("https://openalex.org/", "")
+        # Already an OpenAlex ID (or URL)
+        short_id = author_id.removeprefix(OPENALEX_URL)
+        if short_id[:1] == "A" or len(short_id) != len(author_id):
+            return short_id
 
         # ORCID
         if "orcid.org" in author_id or author_id.startswith("0000-"):
-            orcid = author_id.replace("https://orcid.org/", "").replace("orcid:", "")
+            orcid = author_id.removeprefix("https://orcid.org/").removeprefix("orcid:")
             return f"orcid:{orcid}"
 
         return author_id
@@ -535,12 +1268,16 @@ class OpenAlexAPI:
         select: list[str] | None = None,
     ) -> dict[str, Any]:
         """Get a single institution by ID."""
-        normalized_id = self._normalize_institution_id(institution_id)
-        fields = select or DEFAULT_INSTITUTION_FIELDS
-        params = {"select": ",".join(fields)}
-        if self.email:
-            params["mailto"] = self.email
-        return self._request("GET", f"/institutions/{normalized_id}", params)
+        return self._get_entity("institution", institution_id, select)
+
+    def get_institutions_by_ids(
+        self,
+        institution_ids: list[str],
+        select: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get several institutions by ID with as few requests as possible."""
+        results = self._get_entities_by_ids("institution", institution_ids, select)
+        return [r for r in results if r is not None]
 
     def search_institutions(
         self,
@@ -553,16 +1290,9 @@ class OpenAlexAPI:
         group_by: str | None = None,
     ) -> dict[str, Any]:
         """Search for institutions."""
-        params = self._build_params(
-            filter_str=filter_str,
-            search=query,
-            sort=sort or "cited_by_count:desc",
-            page=page,
-            per_page=per_page,
-            select=select or DEFAULT_INSTITUTION_FIELDS,
-            group_by=group_by,
+        return self._search_entities(
+            "institution", query, filter_str, sort, page, per_page, select, group_by
         )
-        return self._request("GET", "/institutions", params)
 
     def get_institution_works(
         self,
@@ -577,44 +1307,32 @@ class OpenAlexAPI:
         group_by: str | None = None,
     ) -> dict[str, Any]:
         """Get works from an institution."""
-        normalized_id = self._normalize_institution_id(institution_id)
-        # Get full OpenAlex ID if needed
-        if not normalized_id.startswith("I"):
-            inst = self.get_institution(normalized_id, select=["id"])
-            normalized_id = inst["id"].replace("https://openalex.org/", "")
-
-        extra_filters: dict[str, Any] = {
-            "authorships.institutions.id": normalized_id
-        }
-        if from_date:
-            extra_filters["from_publication_date"] = from_date
-        if to_date:
-            extra_filters["to_publication_date"] = to_date
-
-        params = self._build_params(
+        params = self._entity_works_params(
+            "institution",
+            institution_id,
             filter_str=filter_str,
-            sort=sort or "publication_date:desc",
+            from_date=from_date,
+            to_date=to_date,
+            sort=sort,
             page=page,
             per_page=per_page,
-            select=select or DEFAULT_WORK_FIELDS,
+            select=select,
             group_by=group_by,
-            extra_filters=extra_filters,
         )
         return self._request("GET", "/works", params)
 
-    def _normalize_institution_id(self, institution_id: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _normalize_institution_id(institution_id: str) -> str:
         """Normalize institution ID to OpenAlex format."""
-        # Already an OpenAlex ID
-        if institution_id.startswith("I") or institution_id.startswith(
-            "https://openalex.org/"
-        ):
-            return institution_id.replace("https://openalex.org/", "")
+        # Already an OpenAlex ID (or URL)
+        short_id = institution_id.removeprefix(OPENALEX_URL)
+        if short_id[:1] == "I" or len(short_id) != len(institution_id):
+            return short_id
 
         # ROR
         if "ror.org" in institution_id:
             return f"ror:{institution_id.split('/')[-1]}"
-        if institution_id.startswith("ror:"):
-            return institution_id
 
         return institution_id
 
@@ -628,12 +1346,16 @@ class OpenAlexAPI:
         select: list[str] | None = None,
     ) -> dict[str, Any]:
         """Get a single source by ID."""
-        normalized_id = self._normalize_source_id(source_id)
-        fields = select or DEFAULT_SOURCE_FIELDS
-        params = {"select": ",".join(fields)}
-        if self.email:
-            params["mailto"] = self.email
-        return self._request("GET", f"/sources/{normalized_id}", params)
+        return self._get_entity("source", source_id, select)
+
+    def get_sources_by_ids(
+        self,
+        source_ids: list[str],
+        select: list[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get several sources by ID with as few requests as possible."""
+        results = self._get_entities_by_ids("source", source_ids, select)
+        return [r for r in results if r is not None]
 
     def search_sources(
         self,
@@ -646,16 +1368,9 @@ class OpenAlexAPI:
         group_by: str | None = None,
     ) -> dict[str, Any]:
         """Search for sources."""
-        params = self._build_params(
-            filter_str=filter_str,
-            search=query,
-            sort=sort or "cited_by_count:desc",
-            page=page,
-            per_page=per_page,
-            select=select or DEFAULT_SOURCE_FIELDS,
-            group_by=group_by,
+        return self._search_entities(
+            "source", query, filter_str, sort, page, per_page, select, group_by
         )
-        return self._request("GET", "/sources", params)
 
     def get_source_works(
         self,
@@ -670,34 +1385,28 @@ class OpenAlexAPI:
         group_by: str | None = None,
     ) -> dict[str, Any]:
         """Get works from a source."""
-        normalized_id = self._normalize_source_id(source_id)
-        # Get full OpenAlex ID if needed
-        if not normalized_id.startswith("S"):
-            source = self.get_source(normalized_id, select=["id"])
-            normalized_id = source["id"].replace("https://openalex.org/", "")
-
-        extra_filters: dict[str, Any] = {"primary_location.source.id": normalized_id}
-        if from_date:
-            extra_filters["from_publication_date"] = from_date
-        if to_date:
-            extra_filters["to_publication_date"] = to_date
-
-        params = self._build_params(
+        params = self._entity_works_params(
+            "source",
+            source_id,
             filter_str=filter_str,
-            sort=sort or "publication_date:desc",
+            from_date=from_date,
+            to_date=to_date,
+            sort=sort,
             page=page,
             per_page=per_page,
-            select=select or DEFAULT_WORK_FIELDS,
+            select=select,
             group_by=group_by,
-            extra_filters=extra_filters,
         )
         return self._request("GET", "/works", params)
 
-    def _normalize_source_id(self, source_id: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _normalize_source_id(source_id: str) -> str:
         """Normalize source ID to OpenAlex format."""
-        # Already an OpenAlex ID
-        if source_id.startswith("S") or source_id.startswith("https://openalex.org/"):
-            return source_id.replace("https://openalex.org/", "")
+        # Already an OpenAlex ID (or URL)
+        short_id = source_id.removeprefix(OPENALEX_URL)
+        if short_id[:1] == "S" or len(short_id) != len(source_id):
+            return short_id
 
         # ISSN
         if len(source_id) == 9 and source_id[4] == "-":
@@ -706,3 +1415,94 @@ class OpenAlexAPI:
             return source_id.lower()
 
         return source_id
+
+    # -------------------------------------------------------------------------
+    # Async endpoints and concurrent batch lookups
+    # -------------------------------------------------------------------------
+
+    async def aget_work(
+        self,
+        work_id: str,
+        select: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Get a single work by ID (async)."""
+        return await self._aget_entity("work", work_id, select)
+
+    async def aget_author(
+        self,
+        author_id: str,
+        select: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Get a single author by ID (async)."""
+        return await self._aget_entity("author", author_id, select)
+
+    async def aget_institution(
+        self,
+        institution_id: str,
+        select: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Get a single institution by ID (async)."""
+        return await self._aget_entity("institution", institution_id, select)
+
+    async def aget_source(
+        self,
+        source_id: str,
+        select: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Get a single source by ID (async)."""
+        return await self._aget_entity("source", source_id, select)
+
+    async def gather(
+        self,
+        coros: list[Awaitable[T]],
+        concurrency: int = 16,
+    ) -> list[T]:
+        """Await coroutines concurrently with at most `concurrency` in flight.
+
+        Results are returned in the same order as `coros`.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(coro: Awaitable[T]) -> T:
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(bounded(c) for c in coros))
+
+    async def gather_works(
+        self,
+        work_ids: list[str],
+        select: list[str] | None = None,
+        concurrency: int = 16,
+    ) -> list[dict[str, Any]]:
+        """Fetch several works concurrently."""
+        return await self.gather(
+            [self.aget_work(work_id, select) for work_id in work_ids],
+            concurrency=concurrency,
+        )
+
+    async def gather_authors(
+        self,
+        author_ids: list[str],
+        select: list[str] | None = None,
+        concurrency: int = 16,
+    ) -> list[dict[str, Any]]:
+        """Fetch several authors concurrently."""
+        return await self.gather(
+            [self.aget_author(author_id, select) for author_id in author_ids],
+            concurrency=concurrency,
+        )
+
+    def get_works_bulk(
+        self,
+        work_ids: list[str],
+        select: list[str] | None = None,
+        concurrency: int = 16,
+    ) -> list[dict[str, Any]]:
+        """Fetch several works, concurrently when possible.
+
+        Runs the async client in a private event loop. A single ID, or a
+        call from inside a running event loop, uses sequential `get_work`
+        calls instead; use `gather_works` in async code.
+        """
+        return self._get_entities_bulk("work", work_ids, select, concurrency)
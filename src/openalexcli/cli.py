@@ -2,29 +2,18 @@
 
 from __future__ import annotations
 
+import functools
+import logging
 import os
 import sys
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Any, Callable, Optional
 
 import typer
-from rich.console import Console
-
-from openalexcli.api import OpenAlexAPI, APIError
-from openalexcli.formatters import (
-    format_bibtex,
-    format_works_bibtex,
-    format_json,
-    format_error_json,
-    format_works_table,
-    format_authors_table,
-    format_institutions_table,
-    format_sources_table,
-    format_groups_table,
-    format_work_detail,
-    format_author_detail,
-    format_institution_detail,
-    format_source_detail,
-)
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from openalexcli.api import APIError, OpenAlexAPI
 
 # CLI app
 app = typer.Typer(
@@ -42,8 +31,44 @@ app.add_typer(author_app, name="author")
 app.add_typer(institution_app, name="institution")
 app.add_typer(source_app, name="source")
 
-# Console for error output
-console = Console(stderr=True)
+# Options shared by several commands
+EmailOpt = Annotated[
+    Optional[str],
+    typer.Option("--email", help="Email for polite pool"),
+]
+JsonOpt = Annotated[bool, typer.Option("--json", help="Output as JSON")]
+BibtexOpt = Annotated[bool, typer.Option("--bibtex", help="Output as BibTeX")]
+FilterOpt = Annotated[
+    Optional[str],
+    typer.Option("--filter", "-f", help="OpenAlex filter string"),
+]
+FromDateOpt = Annotated[
+    Optional[str],
+    typer.Option("--from-date", help="Start date (YYYY-MM-DD)"),
+]
+ToDateOpt = Annotated[
+    Optional[str],
+    typer.Option("--to-date", help="End date (YYYY-MM-DD)"),
+]
+SortOpt = Annotated[Optional[str], typer.Option("--sort", help="Sort field")]
+GroupByOpt = Annotated[
+    Optional[str],
+    typer.Option("--group-by", help="Group results by field"),
+]
+LimitOpt = Annotated[int, typer.Option("--limit", "-n", help="Number of results")]
+PageOpt = Annotated[int, typer.Option("--page", "-p", help="Page number")]
+
+# Requests in flight when fetching several IDs at once; kept below
+# OpenAlex's rate limit of 10 requests per second
+BULK_CONCURRENCY = 8
+
+
+@functools.cache
+def get_console() -> Console:
+    """Get the console for error output, importing Rich on first use."""
+    from rich.console import Console
+
+    return Console(stderr=True)
 
 
 def get_email() -> str | None:
@@ -51,42 +76,178 @@ def get_email() -> str | None:
     return os.environ.get("OPENALEX_EMAIL")
 
 
+# Global options set by the top-level callback
+_options: dict[str, Any] = {"no_cache": False, "cache_ttl": 86400.0, "is_tty": None}
+
+
+def stdout_is_tty() -> bool:
+    """Return whether stdout is a terminal, probing it once per invocation."""
+    if _options["is_tty"] is None:
+        _options["is_tty"] = sys.stdout.isatty()
+    return _options["is_tty"]
+
+
+@app.callback()
+def main(
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Don't read or write the response cache"),
+    ] = False,
+    cache_ttl: Annotated[
+        float,
+        typer.Option("--cache-ttl", help="Seconds a cached response stays valid"),
+    ] = 86400.0,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Log cache hits and misses to stderr"),
+    ] = False,
+) -> None:
+    """Command-line interface for the OpenAlex API."""
+    _options["no_cache"] = no_cache
+    _options["cache_ttl"] = cache_ttl
+    _options["is_tty"] = sys.stdout.isatty()
+    if verbose:
+        logging.basicConfig(format="%(message)s")
+        logging.getLogger("openalexcli").setLevel(logging.DEBUG)
+
+
+def get_api(email: str | None = None) -> OpenAlexAPI:
+    """Create an API client using the global cache options."""
+    from openalexcli.api import OpenAlexAPI
+    from openalexcli.api.cache import default_cache_dir
+
+    cache_dir = None if _options["no_cache"] else default_cache_dir()
+    return OpenAlexAPI(
+        email=email or get_email(),
+        cache_dir=cache_dir,
+        cache_ttl=_options["cache_ttl"],
+    )
+
+
+def fetch_works(
+    api: OpenAlexAPI,
+    work_ids: list[str],
+    select: list[str] | None = None,
+) -> list[dict]:
+    """Fetch works by ID, batching several IDs into filter queries."""
+    if len(work_ids) <= 1:
+        return api.get_works_bulk(work_ids, select)
+    works = api.get_works_by_ids(
+        work_ids, select, keep_missing=True, concurrency=BULK_CONCURRENCY
+    )
+    missing = [work_id for work_id, work in zip(work_ids, works) if work is None]
+    if not missing:
+        return works
+    # Refetch only the IDs the batch didn't match: direct lookups follow
+    # merged-work redirects, and surface the 404 for IDs that don't exist
+    refetched = iter(api.get_works_bulk(missing, select, BULK_CONCURRENCY))
+    return [work if work is not None else next(refetched) for work in works]
+
+
+def print_json(
+    data: dict | list[dict],
+    meta: dict | None = None,
+) -> None:
+    """Print data as JSON, streaming encoded bytes to stdout when piped."""
+    from openalexcli.formatters import dump_json, stream_json
+
+    is_tty = stdout_is_tty()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None or is_tty:
+        # Pretty output for terminals is small enough to build in one go
+        output = dump_json(data, meta, pretty=is_tty)
+        print(output.decode("utf-8"))
+        return
+    # Flush pending text first so output stays in order
+    sys.stdout.flush()
+    stream_json(data, buffer, meta)
+    buffer.write(b"\n")
+    buffer.flush()
+
+
+def print_bibtex(works: list[dict]) -> None:
+    """Print works as BibTeX, writing each entry to stdout as it is formatted."""
+    from openalexcli.formatters import write_works_bibtex
+
+    write_works_bibtex(sys.stdout, works)
+    sys.stdout.write("\n")
+
+
 def handle_error(e: APIError, use_json: bool = False) -> None:
     """Handle API errors with appropriate output format."""
-    if use_json or not sys.stdout.isatty():
-        print(format_error_json(e.to_dict()))
+    from openalexcli.formatters import format_error_json
+
+    is_tty = stdout_is_tty()
+    if use_json or not is_tty:
+        print(format_error_json(e.to_dict(), pretty=is_tty))
     else:
+        console = get_console()
         console.print(f"[red]Error:[/red] {e.message}")
         if e.suggestion:
             console.print(f"[dim]{e.suggestion}[/dim]")
     raise typer.Exit(1)
 
 
-def output_works(
+def render_detail(
+    result: dict,
+    use_json: bool,
+    format_detail: Callable[[dict], None],
+) -> None:
+    """Print a single entity as JSON when requested or piped, else as a panel."""
+    if use_json or not stdout_is_tty():
+        print_json(result)
+    else:
+        format_detail(result)
+
+
+def render_list(
+    results: list[dict],
+    meta: dict,
+    use_json: bool,
+    format_table: Callable[[list[dict], dict], None],
+) -> None:
+    """Print a list of entities as JSON when requested or piped, else as a table."""
+    if use_json or not stdout_is_tty():
+        print_json(results, meta)
+    else:
+        format_table(results, meta)
+
+
+def render_response(
     response: dict,
     use_json: bool,
-    use_bibtex: bool,
+    format_table: Callable[[list[dict], dict], None],
     group_by: str | None = None,
 ) -> None:
-    """Output works in the appropriate format."""
+    """Print a list response, or its group_by buckets when grouping."""
     meta = response.get("meta", {})
 
     if group_by:
-        groups = response.get("group_by", [])
-        if use_json or not sys.stdout.isatty():
-            print(format_json(groups, meta))
-        else:
-            format_groups_table(groups, group_by, meta)
-        return
+        from openalexcli.formatters import format_groups_table
+
+        render_list(
+            response.get("group_by", []),
+            meta,
+            use_json,
+            lambda groups, meta: format_groups_table(groups, group_by, meta),
+        )
+    else:
+        render_list(response.get("results", []), meta, use_json, format_table)
 
-    results = response.get("results", [])
 
-    if use_bibtex:
-        print(format_works_bibtex(results))
-    elif use_json or not sys.stdout.isatty():
-        print(format_json(results, meta))
+def output_works(
+    response: dict,
+    use_json: bool,
+    use_bibtex: bool,
+    group_by: str | None = None,
+) -> None:
+    """Output works in the appropriate format."""
+    from openalexcli.formatters import format_works_table
+
+    if use_bibtex and not group_by:
+        print_bibtex(response.get("results", []))
     else:
-        format_works_table(results, meta)
+        render_response(response, use_json, format_works_table, group_by)
 
 
 # -----------------------------------------------------------------------------
@@ -97,18 +258,9 @@ def output_works(
 @app.command()
 def search(
     query: Annotated[str, typer.Argument(help="Search query")],
-    filter_str: Annotated[
-        Optional[str],
-        typer.Option("--filter", "-f", help="OpenAlex filter string"),
-    ] = None,
-    from_date: Annotated[
-        Optional[str],
-        typer.Option("--from-date", help="Start date (YYYY-MM-DD)"),
-    ] = None,
-    to_date: Annotated[
-        Optional[str],
-        typer.Option("--to-date", help="End date (YYYY-MM-DD)"),
-    ] = None,
+    filter_str: FilterOpt = None,
+    from_date: FromDateOpt = None,
+    to_date: ToDateOpt = None,
     min_citations: Annotated[
         Optional[int],
         typer.Option("--min-citations", help="Minimum citation count"),
@@ -125,35 +277,20 @@ def search(
         Optional[str],
         typer.Option("--sort", help="Sort field (e.g., cited_by_count:desc)"),
     ] = None,
-    group_by: Annotated[
-        Optional[str],
-        typer.Option("--group-by", help="Group results by field"),
-    ] = None,
+    group_by: GroupByOpt = None,
     limit: Annotated[
         int,
         typer.Option("--limit", "-n", help="Number of results per page"),
     ] = 25,
-    page: Annotated[
-        int,
-        typer.Option("--page", "-p", help="Page number"),
-    ] = 1,
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    use_bibtex: Annotated[
-        bool,
-        typer.Option("--bibtex", help="Output as BibTeX"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    page: PageOpt = 1,
+    use_json: JsonOpt = False,
+    use_bibtex: BibtexOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Search for works in OpenAlex."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             response = api.search_works(
                 query=query,
@@ -179,73 +316,41 @@ def work(
         list[str],
         typer.Argument(help="Work ID(s) - OpenAlex ID, DOI, PMID, etc."),
     ],
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    use_bibtex: Annotated[
-        bool,
-        typer.Option("--bibtex", help="Output as BibTeX"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    use_json: JsonOpt = False,
+    use_bibtex: BibtexOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Get work(s) by ID."""
-    api_email = email or get_email()
-
-    with OpenAlexAPI(email=api_email) as api:
-        works = []
-        for work_id in work_ids:
-            try:
-                result = api.get_work(work_id)
-                works.append(result)
-            except APIError as e:
-                handle_error(e, use_json)
-
-        if len(works) == 1 and not use_bibtex:
-            if use_json or not sys.stdout.isatty():
-                print(format_json(works[0]))
-            else:
-                format_work_detail(works[0])
+    from openalexcli.api import APIError
+    from openalexcli.formatters import format_work_detail, format_works_table
+
+    with get_api(email) as api:
+        try:
+            works = fetch_works(api, work_ids)
+        except APIError as e:
+            handle_error(e, use_json)
+
+        if use_bibtex:
+            print_bibtex(works)
+        elif len(works) == 1:
+            render_detail(works[0], use_json, format_work_detail)
         else:
-            if use_bibtex:
-                print(format_works_bibtex(works))
-            elif use_json or not sys.stdout.isatty():
-                print(format_json(works))
-            else:
-                format_works_table(works)
+            render_list(works, {}, use_json, format_works_table)
 
 
 @app.command()
 def citations(
     work_id: Annotated[str, typer.Argument(help="Work ID")],
-    limit: Annotated[
-        int,
-        typer.Option("--limit", "-n", help="Number of results"),
-    ] = 25,
-    page: Annotated[
-        int,
-        typer.Option("--page", "-p", help="Page number"),
-    ] = 1,
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    use_bibtex: Annotated[
-        bool,
-        typer.Option("--bibtex", help="Output as BibTeX"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    limit: LimitOpt = 25,
+    page: PageOpt = 1,
+    use_json: JsonOpt = False,
+    use_bibtex: BibtexOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Get works that cite a given work."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             response = api.get_citations(
                 work_id=work_id,
@@ -260,31 +365,16 @@ def citations(
 @app.command()
 def references(
     work_id: Annotated[str, typer.Argument(help="Work ID")],
-    limit: Annotated[
-        int,
-        typer.Option("--limit", "-n", help="Number of results"),
-    ] = 25,
-    page: Annotated[
-        int,
-        typer.Option("--page", "-p", help="Page number"),
-    ] = 1,
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    use_bibtex: Annotated[
-        bool,
-        typer.Option("--bibtex", help="Output as BibTeX"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    limit: LimitOpt = 25,
+    page: PageOpt = 1,
+    use_json: JsonOpt = False,
+    use_bibtex: BibtexOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Get works cited by a given work (references)."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             response = api.get_references(
                 work_id=work_id,
@@ -302,24 +392,20 @@ def bibtex(
         list[str],
         typer.Argument(help="Work ID(s)"),
     ],
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    email: EmailOpt = None,
 ) -> None:
     """Export BibTeX citations for work(s)."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
+    from openalexcli.api.client import BIBTEX_WORK_FIELDS
 
-    with OpenAlexAPI(email=api_email) as api:
-        works = []
-        for work_id in work_ids:
-            try:
-                result = api.get_work(work_id)
-                works.append(result)
-            except APIError as e:
-                handle_error(e, use_json=False)
+    with get_api(email) as api:
+        try:
+            # Only request the fields a BibTeX entry uses
+            works = fetch_works(api, work_ids, BIBTEX_WORK_FIELDS)
+        except APIError as e:
+            handle_error(e, use_json=False)
 
-        print(format_works_bibtex(works))
+        print_bibtex(works)
 
 
 # -----------------------------------------------------------------------------
@@ -330,25 +416,17 @@ def bibtex(
 @author_app.command("get")
 def author_get(
     author_id: Annotated[str, typer.Argument(help="Author ID (OpenAlex ID or ORCID)")],
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    use_json: JsonOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Get author details by ID."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
+    from openalexcli.formatters import format_author_detail
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             result = api.get_author(author_id)
-            if use_json or not sys.stdout.isatty():
-                print(format_json(result))
-            else:
-                format_author_detail(result)
+            render_detail(result, use_json, format_author_detail)
         except APIError as e:
             handle_error(e, use_json)
 
@@ -356,39 +434,19 @@ def author_get(
 @author_app.command("search")
 def author_search(
     query: Annotated[str, typer.Argument(help="Search query (author name)")],
-    filter_str: Annotated[
-        Optional[str],
-        typer.Option("--filter", "-f", help="OpenAlex filter string"),
-    ] = None,
-    sort: Annotated[
-        Optional[str],
-        typer.Option("--sort", help="Sort field"),
-    ] = None,
-    group_by: Annotated[
-        Optional[str],
-        typer.Option("--group-by", help="Group results by field"),
-    ] = None,
-    limit: Annotated[
-        int,
-        typer.Option("--limit", "-n", help="Number of results"),
-    ] = 25,
-    page: Annotated[
-        int,
-        typer.Option("--page", "-p", help="Page number"),
-    ] = 1,
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    filter_str: FilterOpt = None,
+    sort: SortOpt = None,
+    group_by: GroupByOpt = None,
+    limit: LimitOpt = 25,
+    page: PageOpt = 1,
+    use_json: JsonOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Search for authors by name."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
+    from openalexcli.formatters import format_authors_table
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             response = api.search_authors(
                 query=query,
@@ -398,21 +456,7 @@ def author_search(
                 per_page=limit,
                 group_by=group_by,
             )
-
-            meta = response.get("meta", {})
-
-            if group_by:
-                groups = response.get("group_by", [])
-                if use_json or not sys.stdout.isatty():
-                    print(format_json(groups, meta))
-                else:
-                    format_groups_table(groups, group_by, meta)
-            else:
-                results = response.get("results", [])
-                if use_json or not sys.stdout.isatty():
-                    print(format_json(results, meta))
-                else:
-                    format_authors_table(results, meta)
+            render_response(response, use_json, format_authors_table, group_by)
         except APIError as e:
             handle_error(e, use_json)
 
@@ -420,51 +464,21 @@ def author_search(
 @author_app.command("works")
 def author_works(
     author_id: Annotated[str, typer.Argument(help="Author ID")],
-    filter_str: Annotated[
-        Optional[str],
-        typer.Option("--filter", "-f", help="OpenAlex filter string"),
-    ] = None,
-    from_date: Annotated[
-        Optional[str],
-        typer.Option("--from-date", help="Start date (YYYY-MM-DD)"),
-    ] = None,
-    to_date: Annotated[
-        Optional[str],
-        typer.Option("--to-date", help="End date (YYYY-MM-DD)"),
-    ] = None,
-    sort: Annotated[
-        Optional[str],
-        typer.Option("--sort", help="Sort field"),
-    ] = None,
-    group_by: Annotated[
-        Optional[str],
-        typer.Option("--group-by", help="Group results by field"),
-    ] = None,
-    limit: Annotated[
-        int,
-        typer.Option("--limit", "-n", help="Number of results"),
-    ] = 25,
-    page: Annotated[
-        int,
-        typer.Option("--page", "-p", help="Page number"),
-    ] = 1,
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    use_bibtex: Annotated[
-        bool,
-        typer.Option("--bibtex", help="Output as BibTeX"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    filter_str: FilterOpt = None,
+    from_date: FromDateOpt = None,
+    to_date: ToDateOpt = None,
+    sort: SortOpt = None,
+    group_by: GroupByOpt = None,
+    limit: LimitOpt = 25,
+    page: PageOpt = 1,
+    use_json: JsonOpt = False,
+    use_bibtex: BibtexOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Get works by an author."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             response = api.get_author_works(
                 author_id=author_id,
@@ -492,25 +506,17 @@ def institution_get(
         str,
         typer.Argument(help="Institution ID (OpenAlex ID or ROR)"),
     ],
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    use_json: JsonOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Get institution details by ID."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
+    from openalexcli.formatters import format_institution_detail
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             result = api.get_institution(institution_id)
-            if use_json or not sys.stdout.isatty():
-                print(format_json(result))
-            else:
-                format_institution_detail(result)
+            render_detail(result, use_json, format_institution_detail)
         except APIError as e:
             handle_error(e, use_json)
 
@@ -518,39 +524,19 @@ def institution_get(
 @institution_app.command("search")
 def institution_search(
     query: Annotated[str, typer.Argument(help="Search query (institution name)")],
-    filter_str: Annotated[
-        Optional[str],
-        typer.Option("--filter", "-f", help="OpenAlex filter string"),
-    ] = None,
-    sort: Annotated[
-        Optional[str],
-        typer.Option("--sort", help="Sort field"),
-    ] = None,
-    group_by: Annotated[
-        Optional[str],
-        typer.Option("--group-by", help="Group results by field"),
-    ] = None,
-    limit: Annotated[
-        int,
-        typer.Option("--limit", "-n", help="Number of results"),
-    ] = 25,
-    page: Annotated[
-        int,
-        typer.Option("--page", "-p", help="Page number"),
-    ] = 1,
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    filter_str: FilterOpt = None,
+    sort: SortOpt = None,
+    group_by: GroupByOpt = None,
+    limit: LimitOpt = 25,
+    page: PageOpt = 1,
+    use_json: JsonOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Search for institutions by name."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
+    from openalexcli.formatters import format_institutions_table
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             response = api.search_institutions(
                 query=query,
@@ -560,21 +546,7 @@ def institution_search(
                 per_page=limit,
                 group_by=group_by,
             )
-
-            meta = response.get("meta", {})
-
-            if group_by:
-                groups = response.get("group_by", [])
-                if use_json or not sys.stdout.isatty():
-                    print(format_json(groups, meta))
-                else:
-                    format_groups_table(groups, group_by, meta)
-            else:
-                results = response.get("results", [])
-                if use_json or not sys.stdout.isatty():
-                    print(format_json(results, meta))
-                else:
-                    format_institutions_table(results, meta)
+            render_response(response, use_json, format_institutions_table, group_by)
         except APIError as e:
             handle_error(e, use_json)
 
@@ -582,51 +554,21 @@ def institution_search(
 @institution_app.command("works")
 def institution_works(
     institution_id: Annotated[str, typer.Argument(help="Institution ID")],
-    filter_str: Annotated[
-        Optional[str],
-        typer.Option("--filter", "-f", help="OpenAlex filter string"),
-    ] = None,
-    from_date: Annotated[
-        Optional[str],
-        typer.Option("--from-date", help="Start date (YYYY-MM-DD)"),
-    ] = None,
-    to_date: Annotated[
-        Optional[str],
-        typer.Option("--to-date", help="End date (YYYY-MM-DD)"),
-    ] = None,
-    sort: Annotated[
-        Optional[str],
-        typer.Option("--sort", help="Sort field"),
-    ] = None,
-    group_by: Annotated[
-        Optional[str],
-        typer.Option("--group-by", help="Group results by field"),
-    ] = None,
-    limit: Annotated[
-        int,
-        typer.Option("--limit", "-n", help="Number of results"),
-    ] = 25,
-    page: Annotated[
-        int,
-        typer.Option("--page", "-p", help="Page number"),
-    ] = 1,
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    use_bibtex: Annotated[
-        bool,
-        typer.Option("--bibtex", help="Output as BibTeX"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    filter_str: FilterOpt = None,
+    from_date: FromDateOpt = None,
+    to_date: ToDateOpt = None,
+    sort: SortOpt = None,
+    group_by: GroupByOpt = None,
+    limit: LimitOpt = 25,
+    page: PageOpt = 1,
+    use_json: JsonOpt = False,
+    use_bibtex: BibtexOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Get works from an institution."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             response = api.get_institution_works(
                 institution_id=institution_id,
@@ -654,25 +596,17 @@ def source_get(
         str,
         typer.Argument(help="Source ID (OpenAlex ID or ISSN)"),
     ],
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    use_json: JsonOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Get source (journal/venue) details by ID."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
+    from openalexcli.formatters import format_source_detail
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             result = api.get_source(source_id)
-            if use_json or not sys.stdout.isatty():
-                print(format_json(result))
-            else:
-                format_source_detail(result)
+            render_detail(result, use_json, format_source_detail)
         except APIError as e:
             handle_error(e, use_json)
 
@@ -680,39 +614,19 @@ def source_get(
 @source_app.command("search")
 def source_search(
     query: Annotated[str, typer.Argument(help="Search query (source name)")],
-    filter_str: Annotated[
-        Optional[str],
-        typer.Option("--filter", "-f", help="OpenAlex filter string"),
-    ] = None,
-    sort: Annotated[
-        Optional[str],
-        typer.Option("--sort", help="Sort field"),
-    ] = None,
-    group_by: Annotated[
-        Optional[str],
-        typer.Option("--group-by", help="Group results by field"),
-    ] = None,
-    limit: Annotated[
-        int,
-        typer.Option("--limit", "-n", help="Number of results"),
-    ] = 25,
-    page: Annotated[
-        int,
-        typer.Option("--page", "-p", help="Page number"),
-    ] = 1,
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    filter_str: FilterOpt = None,
+    sort: SortOpt = None,
+    group_by: GroupByOpt = None,
+    limit: LimitOpt = 25,
+    page: PageOpt = 1,
+    use_json: JsonOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Search for sources (journals/venues) by name."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
+    from openalexcli.formatters import format_sources_table
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             response = api.search_sources(
                 query=query,
@@ -722,21 +636,7 @@ def source_search(
                 per_page=limit,
                 group_by=group_by,
             )
-
-            meta = response.get("meta", {})
-
-            if group_by:
-                groups = response.get("group_by", [])
-                if use_json or not sys.stdout.isatty():
-                    print(format_json(groups, meta))
-                else:
-                    format_groups_table(groups, group_by, meta)
-            else:
-                results = response.get("results", [])
-                if use_json or not sys.stdout.isatty():
-                    print(format_json(results, meta))
-                else:
-                    format_sources_table(results, meta)
+            render_response(response, use_json, format_sources_table, group_by)
         except APIError as e:
             handle_error(e, use_json)
 
@@ -744,51 +644,21 @@ def source_search(
 @source_app.command("works")
 def source_works(
     source_id: Annotated[str, typer.Argument(help="Source ID")],
-    filter_str: Annotated[
-        Optional[str],
-        typer.Option("--filter", "-f", help="OpenAlex filter string"),
-    ] = None,
-    from_date: Annotated[
-        Optional[str],
-        typer.Option("--from-date", help="Start date (YYYY-MM-DD)"),
-    ] = None,
-    to_date: Annotated[
-        Optional[str],
-        typer.Option("--to-date", help="End date (YYYY-MM-DD)"),
-    ] = None,
-    sort: Annotated[
-        Optional[str],
-        typer.Option("--sort", help="Sort field"),
-    ] = None,
-    group_by: Annotated[
-        Optional[str],
-        typer.Option("--group-by", help="Group results by field"),
-    ] = None,
-    limit: Annotated[
-        int,
-        typer.Option("--limit", "-n", help="Number of results"),
-    ] = 25,
-    page: Annotated[
-        int,
-        typer.Option("--page", "-p", help="Page number"),
-    ] = 1,
-    use_json: Annotated[
-        bool,
-        typer.Option("--json", help="Output as JSON"),
-    ] = False,
-    use_bibtex: Annotated[
-        bool,
-        typer.Option("--bibtex", help="Output as BibTeX"),
-    ] = False,
-    email: Annotated[
-        Optional[str],
-        typer.Option("--email", help="Email for polite pool"),
-    ] = None,
+    filter_str: FilterOpt = None,
+    from_date: FromDateOpt = None,
+    to_date: ToDateOpt = None,
+    sort: SortOpt = None,
+    group_by: GroupByOpt = None,
+    limit: LimitOpt = 25,
+    page: PageOpt = 1,
+    use_json: JsonOpt = False,
+    use_bibtex: BibtexOpt = False,
+    email: EmailOpt = None,
 ) -> None:
     """Get works from a source (journal/venue)."""
-    api_email = email or get_email()
+    from openalexcli.api import APIError
 
-    with OpenAlexAPI(email=api_email) as api:
+    with get_api(email) as api:
         try:
             response = api.get_source_works(
                 source_id=source_id,
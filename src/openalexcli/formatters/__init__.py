@@ -1,31 +1,67 @@
 """Output formatters for OpenAlex CLI."""
 
-from openalexcli.formatters.bibtex import format_bibtex, format_works_bibtex
-from openalexcli.formatters.json_fmt import format_json, format_error_json
-from openalexcli.formatters.table import (
-    format_works_table,
-    format_authors_table,
-    format_institutions_table,
-    format_sources_table,
-    format_groups_table,
-    format_work_detail,
-    format_author_detail,
-    format_institution_detail,
-    format_source_detail,
-)
-
-__all__ = [
-    "format_bibtex",
-    "format_works_bibtex",
-    "format_json",
-    "format_error_json",
-    "format_works_table",
-    "format_authors_table",
-    "format_institutions_table",
-    "format_sources_table",
-    "format_groups_table",
-    "format_work_detail",
-    "format_author_detail",
-    "format_institution_detail",
-    "format_source_detail",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from openalexcli.formatters.bibtex import (
+        format_bibtex,
+        format_works_bibtex,
+        write_works_bibtex,
+    )
+    from openalexcli.formatters.json_fmt import (
+        dump_json,
+        format_json,
+        format_error_json,
+        stream_json,
+    )
+    from openalexcli.formatters.table import (
+        format_works_table,
+        format_authors_table,
+        format_institutions_table,
+        format_sources_table,
+        format_groups_table,
+        format_work_detail,
+        format_author_detail,
+        format_institution_detail,
+        format_source_detail,
+    )
+
+# Exported name -> submodule defining it. Submodules are imported on first
+# access (PEP 562) so the CLI only loads the formatter it actually uses.
+_EXPORTS = {
+    "format_bibtex": "bibtex",
+    "format_works_bibtex": "bibtex",
+    "write_works_bibtex": "bibtex",
+    "dump_json": "json_fmt",
+    "format_json": "json_fmt",
+    "format_error_json": "json_fmt",
+    "stream_json": "json_fmt",
+    "format_works_table": "table",
+    "format_authors_table": "table",
+    "format_institutions_table": "table",
+    "format_sources_table": "table",
+    "format_groups_table": "table",
+    "format_work_detail": "table",
+    "format_author_detail": "table",
+    "format_institution_detail": "table",
+    "format_source_detail": "table",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
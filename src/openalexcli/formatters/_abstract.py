@@ -0,0 +1,28 @@
+"""Abstract reconstruction shared by the output formatters."""
+
+from __future__ import annotations
+
+from operator import itemgetter
+
+_POSITION = itemgetter(0)
+_WORD = itemgetter(1)
+
+
+def reconstruct_abstract(inverted_index: dict[str, list[int]] | None) -> str:
+    """
+    Reconstruct abstract from OpenAlex inverted index format.
+
+    Args:
+        inverted_index: Mapping of each word to the positions it occurs at
+
+    Returns:
+        The abstract text, or an empty string if there is none
+    """
+    if not inverted_index:
+        return ""
+
+    # Flatten to (position, word) pairs in a single walk over the index and
+    # order them with one C-level sort; gaps in the positions simply vanish
+    pairs = [(pos, word) for word, positions in inverted_index.items() for pos in positions]
+    pairs.sort(key=_POSITION)
+    return " ".join(map(_WORD, pairs))
@@ -2,13 +2,73 @@
 
 from __future__ import annotations
 
+import functools
+import io
 import re
 import unicodedata
-from typing import Any
+from operator import itemgetter
+from types import MappingProxyType
+from typing import IO, Any
+
+from openalexcli.formatters._abstract import reconstruct_abstract
+
+# Shared read-only default for missing nested objects
+_EMPTY: MappingProxyType[str, Any] = MappingProxyType({})
+
+_AUTHOR = itemgetter("author")
+_DISPLAY_NAME = itemgetter("display_name")
+
+_NON_ALPHA_RE = re.compile(r"[^a-z]")
+_WORD_RE = re.compile(r"[a-zA-Z]+")
+
+# Title words skipped when picking the citation key's title part
+_STOPWORDS = frozenset({"a", "an", "the", "on", "in", "of", "for", "to", "and", "with"})
+
+# OpenAlex work type -> BibTeX entry type
+_TYPE_MAPPING = {
+    "journal-article": "article",
+    "article": "article",
+    "proceedings-article": "inproceedings",
+    "book": "book",
+    "book-chapter": "incollection",
+    "dissertation": "phdthesis",
+    "dataset": "misc",
+    "preprint": "unpublished",
+    "report": "techreport",
+}
+
+# BibTeX entry type -> field holding the source name (default: publisher)
+_SOURCE_FIELDS = {
+    "article": "journal",
+    "inproceedings": "booktitle",
+    "incollection": "booktitle",
+}
+
+# Applied in a single pass, so replacements are never re-escaped
+_LATEX_ESCAPES = str.maketrans(
+    {
+        "\\": "\\textbackslash{}",
+        "&": "\\&",
+        "%": "\\%",
+        "$": "\\$",
+        "#": "\\#",
+        "_": "\\_",
+        "{": "\\{",
+        "}": "\\}",
+        "~": "\\textasciitilde{}",
+        "^": "\\textasciicircum{}",
+    }
+)
+_LATEX_SPECIAL_SEARCH = re.compile(r"[\\&%$#_{}~^]").search
+_LATEX_SCAN_MAX_LEN = 128
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_to_ascii(text: str) -> str:
     """Normalize unicode characters to ASCII equivalents."""
+    # ASCII is unchanged by NFKD, so skip the round-trip for the common case
+    if text.isascii():
+        return text
     # Normalize to decomposed form, then encode to ASCII ignoring errors
     normalized = unicodedata.normalize("NFKD", text)
     return normalized.encode("ascii", "ignore").decode("ascii")
@@ -18,35 +78,46 @@ def _escape_latex(text: str) -> str:
     """Escape special LaTeX characters."""
     if not text:
         return ""
-    replacements = [
-        ("\\", "\\textbackslash{}"),
-        ("&", "\\&"),
-        ("%", "\\%"),
-        ("$", "\\$"),
-        ("#", "\\#"),
-        ("_", "\\_"),
-        ("{", "\\{"),
-        ("}", "\\}"),
-        ("~", "\\textasciitilde{}"),
-        ("^", "\\textasciicircum{}"),
-    ]
-    for old, new in replacements:
-        text = text.replace(old, new)
-    return text
+    # Most titles and names need no escaping; for short strings a read-only
+    # scan is cheaper than translate() building a copy. Long text (abstracts)
+    # is faster to translate outright.
+    if len(text) <= _LATEX_SCAN_MAX_LEN and _LATEX_SPECIAL_SEARCH(text) is None:
+        return text
+    return text.translate(_LATEX_ESCAPES)
+
+
+def _author_name(authorship: dict[str, Any]) -> str:
+    """Get an authorship's display name, or an empty string if it has none."""
+    # Item lookups are C calls; OpenAlex nearly always includes both keys
+    try:
+        return _DISPLAY_NAME(_AUTHOR(authorship)) or ""
+    except (KeyError, TypeError):
+        return (authorship.get("author") or _EMPTY).get("display_name") or ""
+
+
+@functools.lru_cache(maxsize=4096)
+def _citation_key_name(author_name: str) -> str:
+    """Return the citation key part for an author's display name."""
+    # Extract last name (last word of name)
+    last_name = author_name.split()[-1] if author_name.strip() else "unknown"
+    last_name = _normalize_to_ascii(last_name).lower()
+    return _NON_ALPHA_RE.sub("", last_name)
+
+
+@functools.lru_cache(maxsize=4096)
+def _citation_key_title(title: str) -> str:
+    """Return the citation key part for a title: its first significant word."""
+    # Remove common words and get first significant word
+    words = _WORD_RE.findall(title.lower())
+    title_word = next((w for w in words if w not in _STOPWORDS), "untitled")
+    return _normalize_to_ascii(title_word)
 
 
 def _generate_citation_key(work: dict[str, Any]) -> str:
     """Generate a citation key from work metadata."""
     # Get first author's last name
-    authorships = work.get("authorships", [])
-    if authorships:
-        author_name = authorships[0].get("author", {}).get("display_name", "")
-        # Extract last name (last word of name)
-        last_name = author_name.split()[-1] if author_name else "unknown"
-        last_name = _normalize_to_ascii(last_name).lower()
-        last_name = re.sub(r"[^a-z]", "", last_name)
-    else:
-        last_name = "unknown"
+    authorships = work.get("authorships") or ()
+    last_name = _citation_key_name(_author_name(authorships[0])) if authorships else "unknown"
 
     # Get year
     year = work.get("publication_year", "")
@@ -55,36 +126,14 @@ def _generate_citation_key(work: dict[str, Any]) -> str:
 
     # Get first meaningful word from title
     title = work.get("title", "")
-    if title:
-        # Remove common words and get first significant word
-        stopwords = {"a", "an", "the", "on", "in", "of", "for", "to", "and", "with"}
-        words = re.findall(r"[a-zA-Z]+", title.lower())
-        title_word = next((w for w in words if w not in stopwords), "untitled")
-        title_word = _normalize_to_ascii(title_word)
-    else:
-        title_word = "untitled"
+    title_word = _citation_key_title(title) if title else "untitled"
 
     return f"{last_name}{year}{title_word}"
 
 
 def _reconstruct_abstract(inverted_index: dict[str, list[int]] | None) -> str:
     """Reconstruct abstract from OpenAlex inverted index format."""
-    if not inverted_index:
-        return ""
-
-    # Find max position
-    max_pos = 0
-    for positions in inverted_index.values():
-        if positions:
-            max_pos = max(max_pos, max(positions))
-
-    # Reconstruct
-    words = [""] * (max_pos + 1)
-    for word, positions in inverted_index.items():
-        for pos in positions:
-            words[pos] = word
-
-    abstract = " ".join(words)
+    abstract = reconstruct_abstract(inverted_index)
     # Truncate if too long
     if len(abstract) > 1000:
         abstract = abstract[:997] + "..."
@@ -93,23 +142,11 @@ def _reconstruct_abstract(inverted_index: dict[str, list[int]] | None) -> str:
 
 def _get_entry_type(work: dict[str, Any]) -> str:
     """Determine BibTeX entry type from work type."""
-    work_type = work.get("type", "")
-    type_mapping = {
-        "journal-article": "article",
-        "article": "article",
-        "proceedings-article": "inproceedings",
-        "book": "book",
-        "book-chapter": "incollection",
-        "dissertation": "phdthesis",
-        "dataset": "misc",
-        "preprint": "unpublished",
-        "report": "techreport",
-    }
-    return type_mapping.get(work_type, "misc")
+    return _TYPE_MAPPING.get(work.get("type", ""), "misc")
 
 
-def format_bibtex(work: dict[str, Any]) -> str:
-    """Format a single work as BibTeX."""
+def _write_bibtex(buf: IO[str], work: dict[str, Any]) -> None:
+    """Write a single work as a BibTeX entry to `buf`."""
     entry_type = _get_entry_type(work)
     citation_key = _generate_citation_key(work)
 
@@ -121,16 +158,11 @@ def format_bibtex(work: dict[str, Any]) -> str:
         fields.append(("title", f"{{{_escape_latex(title)}}}"))
 
     # Authors
-    authorships = work.get("authorships", [])
-    if authorships:
-        authors = []
-        for authorship in authorships:
-            author = authorship.get("author", {})
-            name = author.get("display_name", "")
-            if name:
-                authors.append(_escape_latex(name))
-        if authors:
-            fields.append(("author", "{" + " and ".join(authors) + "}"))
+    authorships = work.get("authorships") or ()
+    names = map(_author_name, authorships)
+    authors_str = " and ".join(_escape_latex(name) for name in names if name)
+    if authors_str:
+        fields.append(("author", "{" + authors_str + "}"))
 
     # Year
     year = work.get("publication_year")
@@ -138,35 +170,32 @@ def format_bibtex(work: dict[str, Any]) -> str:
         fields.append(("year", str(year)))
 
     # Journal/Booktitle/Publisher
-    primary_location = work.get("primary_location", {}) or {}
-    source = primary_location.get("source", {}) or {}
-    source_name = source.get("display_name", "")
+    try:
+        source_name = work["primary_location"]["source"]["display_name"]
+    except (KeyError, TypeError):
+        # Missing location/source, or either one is null
+        source_name = ""
 
     if source_name:
-        if entry_type == "article":
-            fields.append(("journal", f"{{{_escape_latex(source_name)}}}"))
-        elif entry_type in ("inproceedings", "incollection"):
-            fields.append(("booktitle", f"{{{_escape_latex(source_name)}}}"))
-        else:
-            fields.append(("publisher", f"{{{_escape_latex(source_name)}}}"))
+        source_field = _SOURCE_FIELDS.get(entry_type, "publisher")
+        fields.append((source_field, f"{{{_escape_latex(source_name)}}}"))
 
     # Volume, Issue, Pages from biblio
-    biblio = work.get("biblio", {}) or {}
-    if biblio.get("volume"):
-        fields.append(("volume", str(biblio["volume"])))
-    if biblio.get("issue"):
-        fields.append(("number", str(biblio["issue"])))
-    if biblio.get("first_page"):
-        pages = biblio["first_page"]
-        if biblio.get("last_page"):
-            pages += f"--{biblio['last_page']}"
+    biblio = work.get("biblio") or _EMPTY
+    if volume := biblio.get("volume"):
+        fields.append(("volume", str(volume)))
+    if issue := biblio.get("issue"):
+        fields.append(("number", str(issue)))
+    if pages := biblio.get("first_page"):
+        if last_page := biblio.get("last_page"):
+            pages += f"--{last_page}"
         fields.append(("pages", pages))
 
     # DOI
     doi = work.get("doi")
     if doi:
         # Clean up DOI URL
-        doi_clean = doi.replace("https://doi.org/", "")
+        doi_clean = doi.removeprefix("https://doi.org/")
         fields.append(("doi", doi_clean))
 
     # URL (OpenAlex URL as fallback)
@@ -181,16 +210,34 @@ def format_bibtex(work: dict[str, Any]) -> str:
         fields.append(("abstract", f"{{{_escape_latex(abstract)}}}"))
 
     # Build BibTeX entry
-    lines = [f"@{entry_type}{{{citation_key},"]
-    for i, (key, value) in enumerate(fields):
-        comma = "," if i < len(fields) - 1 else ""
-        lines.append(f"  {key} = {value}{comma}")
-    lines.append("}")
+    buf.write(f"@{entry_type}{{{citation_key},")
+    separator = "\n  "
+    for key, value in fields:
+        buf.write(separator)
+        buf.write(key)
+        buf.write(" = ")
+        buf.write(value)
+        separator = ",\n  "
+    buf.write("\n}")
+
+
+def format_bibtex(work: dict[str, Any]) -> str:
+    """Format a single work as BibTeX."""
+    buf = io.StringIO()
+    _write_bibtex(buf, work)
+    return buf.getvalue()
+
 
-    return "\n".join(lines)
+def write_works_bibtex(fp: IO[str], works: list[dict[str, Any]]) -> None:
+    """Write multiple works as BibTeX entries to a text file, entry by entry."""
+    for i, work in enumerate(works):
+        if i:
+            fp.write("\n\n")
+        _write_bibtex(fp, work)
 
 
 def format_works_bibtex(works: list[dict[str, Any]]) -> str:
     """Format multiple works as BibTeX entries."""
-    entries = [format_bibtex(work) for work in works]
-    return "\n\n".join(entries)
+    buf = io.StringIO()
+    write_works_bibtex(buf, works)
+    return buf.getvalue()
@@ -4,25 +4,30 @@ from __future__ import annotations
 
 import json
 import sys
-from typing import Any
+from typing import IO, Any, Iterable
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
 
-def format_json(
-    data: dict[str, Any] | list[dict[str, Any]],
-    meta: dict[str, Any] | None = None,
-    pretty: bool | None = None,
-) -> str:
-    """
-    Format data as JSON.
 
-    Args:
-        data: The data to format (single item or list)
-        meta: Optional metadata to include
-        pretty: Force pretty printing (None = auto-detect based on tty)
-    """
-    if pretty is None:
-        pretty = sys.stdout.isatty()
+def _dumps(obj: Any, pretty: bool) -> bytes:
+    """Serialize `obj` to UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    indent = 2 if pretty else None
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
+
 
+def _wrap(
+    data: dict[str, Any] | list[dict[str, Any]],
+    meta: dict[str, Any] | None,
+) -> dict[str, Any]:
+    """Wrap data in the output envelope used by format_json."""
     output: dict[str, Any] = {}
 
     if isinstance(data, list):
@@ -33,19 +38,71 @@ def format_json(
 
     if meta:
         output["meta"] = meta
+    return output
 
-    if pretty:
-        return json.dumps(output, indent=2, ensure_ascii=False)
-    else:
-        return json.dumps(output, ensure_ascii=False)
+
+def dump_json(
+    data: dict[str, Any] | list[dict[str, Any]],
+    meta: dict[str, Any] | None = None,
+    pretty: bool | None = None,
+) -> bytes:
+    """
+    Format data as UTF-8 encoded JSON.
+
+    Same as format_json, but skips decoding the serialized bytes to a str.
+    """
+    if pretty is None:
+        pretty = sys.stdout.isatty()
+    return _dumps(_wrap(data, meta), pretty)
+
+
+def stream_json(
+    data: dict[str, Any] | Iterable[dict[str, Any]],
+    fp: IO[bytes],
+    meta: dict[str, Any] | None = None,
+) -> None:
+    """
+    Write data as compact JSON to a binary file, one result at a time.
+
+    Produces the same envelope as format_json, but never holds more than one
+    serialized result in memory, so `data` may be any iterable of results.
+    """
+    if isinstance(data, dict):
+        fp.write(_dumps(_wrap(data, meta), pretty=False))
+        return
+
+    fp.write(b'{"results":[')
+    count = 0
+    for item in data:
+        if count:
+            fp.write(b",")
+        fp.write(_dumps(item, pretty=False))
+        count += 1
+    fp.write(b'],"count":%d' % count)
+    if meta:
+        fp.write(b',"meta":')
+        fp.write(_dumps(meta, pretty=False))
+    fp.write(b"}")
+
+
+def format_json(
+    data: dict[str, Any] | list[dict[str, Any]],
+    meta: dict[str, Any] | None = None,
+    pretty: bool | None = None,
+) -> str:
+    """
+    Format data as JSON.
+
+    Args:
+        data: The data to format (single item or list)
+        meta: Optional metadata to include
+        pretty: Force pretty printing (None = auto-detect based on tty)
+    """
+    return dump_json(data, meta, pretty).decode("utf-8")
 
 
 def format_error_json(error: dict[str, Any], pretty: bool | None = None) -> str:
     """Format an error as JSON."""
     if pretty is None:
         pretty = sys.stdout.isatty()
-
-    if pretty:
-        return json.dumps(error, indent=2, ensure_ascii=False)
-    else:
-        return json.dumps(error, ensure_ascii=False)
+    return _dumps(error, pretty).decode("utf-8")
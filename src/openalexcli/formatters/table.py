@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any
+import functools
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
+from openalexcli.formatters._abstract import reconstruct_abstract
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
 
+
+# Shared read-only default for missing nested objects
+_EMPTY: MappingProxyType[str, Any] = MappingProxyType({})
+
+
+# Display names repeat heavily across rows (institutions, authors, venues)
+@functools.lru_cache(maxsize=2048)
 def _truncate(text: str, max_length: int = 60) -> str:
     """Truncate text to max length with ellipsis."""
     if not text:
@@ -26,7 +35,7 @@ def _format_authors(authorships: list[dict[str, Any]], max_authors: int = 3) ->
 
     authors = []
     for authorship in authorships[:max_authors]:
-        author = authorship.get("author", {})
+        author = authorship.get("author") or _EMPTY
         name = author.get("display_name", "")
         if name:
             authors.append(name)
@@ -50,7 +59,24 @@ def _get_openalex_short_id(full_id: str) -> str:
     """Extract short ID from full OpenAlex URL."""
     if not full_id:
         return ""
-    return full_id.replace("https://openalex.org/", "")
+    return full_id.removeprefix("https://openalex.org/")
+
+
+@functools.cache
+def _default_console() -> Console:
+    """Return the shared console, importing Rich on first use."""
+    # Rich is imported lazily so BibTeX and JSON output don't pay for it
+    from rich.console import Console
+
+    # Creating a console probes the terminal, so do it once per process
+    return Console()
+
+
+def _print_rows(console: Console, table: Table, rows: list[tuple[str, ...]]) -> None:
+    """Add `rows` to `table` and print it."""
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
 
 
 # -----------------------------------------------------------------------------
@@ -61,9 +87,12 @@ def _get_openalex_short_id(full_id: str) -> str:
 def format_works_table(
     works: list[dict[str, Any]],
     meta: dict[str, Any] | None = None,
+    console: Console | None = None,
 ) -> None:
     """Print works as a Rich table."""
-    console = Console()
+    from rich.table import Table
+
+    console = console or _default_console()
 
     table = Table(show_header=True, header_style="bold")
     table.add_column("ID", style="dim", no_wrap=True)
@@ -72,16 +101,17 @@ def format_works_table(
     table.add_column("Title", max_width=50)
     table.add_column("Authors", max_width=30)
 
-    for work in works:
-        work_id = _get_openalex_short_id(work.get("id", ""))
-        year = str(work.get("publication_year", "")) or "-"
-        citations = _format_number(work.get("cited_by_count"))
-        title = _truncate(work.get("title", "") or "", 50)
-        authors = _truncate(_format_authors(work.get("authorships", [])), 30)
-
-        table.add_row(work_id, year, citations, title, authors)
-
-    console.print(table)
+    rows = [
+        (
+            _get_openalex_short_id(work.get("id", "")),
+            str(work.get("publication_year", "")) or "-",
+            _format_number(work.get("cited_by_count")),
+            _truncate(work.get("title", "") or "", 50),
+            _truncate(_format_authors(work.get("authorships") or ()), 30),
+        )
+        for work in works
+    ]
+    _print_rows(console, table, rows)
 
     if meta:
         total = meta.get("count", 0)
@@ -96,9 +126,12 @@ def format_works_table(
 def format_authors_table(
     authors: list[dict[str, Any]],
     meta: dict[str, Any] | None = None,
+    console: Console | None = None,
 ) -> None:
     """Print authors as a Rich table."""
-    console = Console()
+    from rich.table import Table
+
+    console = console or _default_console()
 
     table = Table(show_header=True, header_style="bold")
     table.add_column("ID", style="dim", no_wrap=True)
@@ -108,6 +141,7 @@ def format_authors_table(
     table.add_column("h-index", justify="right")
     table.add_column("Affiliations", max_width=35)
 
+    rows = []
     for author in authors:
         author_id = _get_openalex_short_id(author.get("id", ""))
         name = _truncate(author.get("display_name", "") or "", 30)
@@ -115,11 +149,11 @@ def format_authors_table(
         citations = _format_number(author.get("cited_by_count"))
 
         # h-index from summary_stats
-        summary = author.get("summary_stats", {}) or {}
+        summary = author.get("summary_stats") or _EMPTY
         h_index = str(summary.get("h_index", "-")) if summary else "-"
 
         # Affiliations
-        affiliations = author.get("last_known_institutions", []) or []
+        affiliations = author.get("last_known_institutions") or ()
         if affiliations:
             aff_names = [
                 a.get("display_name", "") for a in affiliations[:2] if a
@@ -131,9 +165,9 @@ def format_authors_table(
             aff_str = "-"
         aff_str = _truncate(aff_str, 35)
 
-        table.add_row(author_id, name, works_count, citations, h_index, aff_str)
+        rows.append((author_id, name, works_count, citations, h_index, aff_str))
 
-    console.print(table)
+    _print_rows(console, table, rows)
 
     if meta:
         total = meta.get("count", 0)
@@ -146,9 +180,12 @@ def format_authors_table(
 def format_institutions_table(
     institutions: list[dict[str, Any]],
     meta: dict[str, Any] | None = None,
+    console: Console | None = None,
 ) -> None:
     """Print institutions as a Rich table."""
-    console = Console()
+    from rich.table import Table
+
+    console = console or _default_console()
 
     table = Table(show_header=True, header_style="bold")
     table.add_column("ID", style="dim", no_wrap=True)
@@ -158,17 +195,18 @@ def format_institutions_table(
     table.add_column("Works", justify="right")
     table.add_column("Cited", justify="right")
 
-    for inst in institutions:
-        inst_id = _get_openalex_short_id(inst.get("id", ""))
-        name = _truncate(inst.get("display_name", "") or "", 40)
-        country = inst.get("country_code", "") or "-"
-        inst_type = inst.get("type", "") or "-"
-        works_count = _format_number(inst.get("works_count"))
-        citations = _format_number(inst.get("cited_by_count"))
-
-        table.add_row(inst_id, name, country, inst_type, works_count, citations)
-
-    console.print(table)
+    rows = [
+        (
+            _get_openalex_short_id(inst.get("id", "")),
+            _truncate(inst.get("display_name", "") or "", 40),
+            inst.get("country_code", "") or "-",
+            inst.get("type", "") or "-",
+            _format_number(inst.get("works_count")),
+            _format_number(inst.get("cited_by_count")),
+        )
+        for inst in institutions
+    ]
+    _print_rows(console, table, rows)
 
     if meta:
         total = meta.get("count", 0)
@@ -181,9 +219,12 @@ def format_institutions_table(
 def format_sources_table(
     sources: list[dict[str, Any]],
     meta: dict[str, Any] | None = None,
+    console: Console | None = None,
 ) -> None:
     """Print sources as a Rich table."""
-    console = Console()
+    from rich.table import Table
+
+    console = console or _default_console()
 
     table = Table(show_header=True, header_style="bold")
     table.add_column("ID", style="dim", no_wrap=True)
@@ -193,17 +234,18 @@ def format_sources_table(
     table.add_column("Works", justify="right")
     table.add_column("Cited", justify="right")
 
-    for source in sources:
-        source_id = _get_openalex_short_id(source.get("id", ""))
-        name = _truncate(source.get("display_name", "") or "", 45)
-        source_type = source.get("type", "") or "-"
-        is_oa = "Yes" if source.get("is_oa") else "No"
-        works_count = _format_number(source.get("works_count"))
-        citations = _format_number(source.get("cited_by_count"))
-
-        table.add_row(source_id, name, source_type, is_oa, works_count, citations)
-
-    console.print(table)
+    rows = [
+        (
+            _get_openalex_short_id(source.get("id", "")),
+            _truncate(source.get("display_name", "") or "", 45),
+            source.get("type", "") or "-",
+            "Yes" if source.get("is_oa") else "No",
+            _format_number(source.get("works_count")),
+            _format_number(source.get("cited_by_count")),
+        )
+        for source in sources
+    ]
+    _print_rows(console, table, rows)
 
     if meta:
         total = meta.get("count", 0)
@@ -217,9 +259,12 @@ def format_groups_table(
     groups: list[dict[str, Any]],
     group_by: str,
     meta: dict[str, Any] | None = None,
+    console: Console | None = None,
 ) -> None:
     """Print group_by results as a Rich table."""
-    console = Console()
+    from rich.table import Table
+
+    console = console or _default_console()
 
     table = Table(
         show_header=True,
@@ -230,15 +275,13 @@ def format_groups_table(
     table.add_column("Name", max_width=50)
     table.add_column("Count", justify="right")
 
+    rows = []
     for group in groups:
         key = str(group.get("key", ""))
-        display_name = group.get("key_display_name", "") or key
-        display_name = _truncate(display_name, 50)
-        count = _format_number(group.get("count"))
+        display_name = _truncate(group.get("key_display_name", "") or key, 50)
+        rows.append((key, display_name, _format_number(group.get("count"))))
 
-        table.add_row(key, display_name, count)
-
-    console.print(table)
+    _print_rows(console, table, rows)
 
     if meta:
         total = meta.get("count", 0)
@@ -251,27 +294,11 @@ def format_groups_table(
 # -----------------------------------------------------------------------------
 
 
-def _reconstruct_abstract(inverted_index: dict[str, list[int]] | None) -> str:
-    """Reconstruct abstract from OpenAlex inverted index format."""
-    if not inverted_index:
-        return ""
-
-    max_pos = 0
-    for positions in inverted_index.values():
-        if positions:
-            max_pos = max(max_pos, max(positions))
-
-    words = [""] * (max_pos + 1)
-    for word, positions in inverted_index.items():
-        for pos in positions:
-            words[pos] = word
-
-    return " ".join(words)
-
-
-def format_work_detail(work: dict[str, Any]) -> None:
+def format_work_detail(work: dict[str, Any], console: Console | None = None) -> None:
     """Print detailed work information."""
-    console = Console()
+    from rich.panel import Panel
+
+    console = console or _default_console()
 
     work_id = _get_openalex_short_id(work.get("id", ""))
     title = work.get("title", "") or "Untitled"
@@ -289,35 +316,29 @@ def format_work_detail(work: dict[str, Any]) -> None:
     lines.append(f"[bold]Citations:[/bold] {_format_number(work.get('cited_by_count'))}")
 
     # Open access
-    oa = work.get("open_access", {}) or {}
+    oa = work.get("open_access") or _EMPTY
     oa_status = "Yes" if oa.get("is_oa") else "No"
     lines.append(f"[bold]Open Access:[/bold] {oa_status}")
     if oa.get("oa_url"):
         lines.append(f"[bold]OA URL:[/bold] {oa['oa_url']}")
 
     # Source
-    primary_location = work.get("primary_location", {}) or {}
-    source = primary_location.get("source", {}) or {}
+    primary_location = work.get("primary_location") or _EMPTY
+    source = primary_location.get("source") or _EMPTY
     if source.get("display_name"):
         lines.append(f"[bold]Source:[/bold] {source['display_name']}")
 
     # Authors
-    authorships = work.get("authorships", [])
-    if authorships:
-        author_names = []
-        for authorship in authorships[:10]:
-            author = authorship.get("author", {})
-            name = author.get("display_name", "")
-            if name:
-                author_names.append(name)
-        if author_names:
-            authors_str = ", ".join(author_names)
-            if len(authorships) > 10:
-                authors_str += f" (+{len(authorships) - 10} more)"
-            lines.append(f"[bold]Authors:[/bold] {authors_str}")
+    authorships = work.get("authorships") or ()
+    names = ((a.get("author") or _EMPTY).get("display_name") for a in authorships[:10])
+    authors_str = ", ".join(name for name in names if name)
+    if authors_str:
+        if len(authorships) > 10:
+            authors_str += f" (+{len(authorships) - 10} more)"
+        lines.append(f"[bold]Authors:[/bold] {authors_str}")
 
     # Abstract
-    abstract = _reconstruct_abstract(work.get("abstract_inverted_index"))
+    abstract = reconstruct_abstract(work.get("abstract_inverted_index"))
     if abstract:
         lines.append("")
         lines.append("[bold]Abstract:[/bold]")
@@ -325,7 +346,7 @@ def format_work_detail(work: dict[str, Any]) -> None:
         lines.append(abstract[:500] + ("..." if len(abstract) > 500 else ""))
 
     # Topics
-    topics = work.get("topics", [])
+    topics = work.get("topics") or ()
     if topics:
         topic_names = [t.get("display_name", "") for t in topics[:5] if t]
         if topic_names:
@@ -341,9 +362,11 @@ def format_work_detail(work: dict[str, Any]) -> None:
     console.print(panel)
 
 
-def format_author_detail(author: dict[str, Any]) -> None:
+def format_author_detail(author: dict[str, Any], console: Console | None = None) -> None:
     """Print detailed author information."""
-    console = Console()
+    from rich.panel import Panel
+
+    console = console or _default_console()
 
     author_id = _get_openalex_short_id(author.get("id", ""))
     name = author.get("display_name", "") or "Unknown"
@@ -359,7 +382,7 @@ def format_author_detail(author: dict[str, Any]) -> None:
     lines.append(f"[bold]Citations:[/bold] {_format_number(author.get('cited_by_count'))}")
 
     # Summary stats
-    summary = author.get("summary_stats", {}) or {}
+    summary = author.get("summary_stats") or _EMPTY
     if summary:
         if summary.get("h_index") is not None:
             lines.append(f"[bold]h-index:[/bold] {summary['h_index']}")
@@ -367,7 +390,7 @@ def format_author_detail(author: dict[str, Any]) -> None:
             lines.append(f"[bold]i10-index:[/bold] {summary['i10_index']}")
 
     # Affiliations
-    affiliations = author.get("last_known_institutions", []) or []
+    affiliations = author.get("last_known_institutions") or ()
     if affiliations:
         lines.append("")
         lines.append("[bold]Affiliations:[/bold]")
@@ -379,7 +402,7 @@ def format_author_detail(author: dict[str, Any]) -> None:
                     lines.append(f"  - {aff_name}" + (f" ({country})" if country else ""))
 
     # Topics
-    topics = author.get("topics", [])
+    topics = author.get("topics") or ()
     if topics:
         topic_names = [t.get("display_name", "") for t in topics[:5] if t]
         if topic_names:
@@ -395,9 +418,11 @@ def format_author_detail(author: dict[str, Any]) -> None:
     console.print(panel)
 
 
-def format_institution_detail(inst: dict[str, Any]) -> None:
+def format_institution_detail(inst: dict[str, Any], console: Console | None = None) -> None:
     """Print detailed institution information."""
-    console = Console()
+    from rich.panel import Panel
+
+    console = console or _default_console()
 
     inst_id = _get_openalex_short_id(inst.get("id", ""))
     name = inst.get("display_name", "") or "Unknown"
@@ -415,7 +440,7 @@ def format_institution_detail(inst: dict[str, Any]) -> None:
     lines.append(f"[bold]Citations:[/bold] {_format_number(inst.get('cited_by_count'))}")
 
     # Summary stats
-    summary = inst.get("summary_stats", {}) or {}
+    summary = inst.get("summary_stats") or _EMPTY
     if summary:
         if summary.get("h_index") is not None:
             lines.append(f"[bold]h-index:[/bold] {summary['h_index']}")
@@ -429,9 +454,11 @@ def format_institution_detail(inst: dict[str, Any]) -> None:
     console.print(panel)
 
 
-def format_source_detail(source: dict[str, Any]) -> None:
+def format_source_detail(source: dict[str, Any], console: Console | None = None) -> None:
     """Print detailed source information."""
-    console = Console()
+    from rich.panel import Panel
+
+    console = console or _default_console()
 
     source_id = _get_openalex_short_id(source.get("id", ""))
     name = source.get("display_name", "") or "Unknown"
@@ -449,7 +476,7 @@ def format_source_detail(source: dict[str, Any]) -> None:
     lines.append(f"[bold]Citations:[/bold] {_format_number(source.get('cited_by_count'))}")
 
     # Summary stats
-    summary = source.get("summary_stats", {}) or {}
+    summary = source.get("summary_stats") or _EMPTY
     if summary:
         if summary.get("h_index") is not None:
             lines.append(f"[bold]h-index:[/bold] {summary['h_index']}")
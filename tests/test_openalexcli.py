@@ -7,17 +7,34 @@ Covers:
 - Abstract reconstruction from inverted index
 """
 
+import io
+import json
+import os
+import pickle
+import subprocess
+import sys
+import time
+
+import httpx
 import pytest
 from unittest.mock import Mock, patch
 
-from openalexcli.api.client import OpenAlexAPI, DEFAULT_WORK_FIELDS
+from openalexcli.api.cache import CacheTransport, ResponseCache
+from openalexcli.api.client import (
+    OpenAlexAPI,
+    APIError,
+    RateLimitError,
+    DEFAULT_WORK_FIELDS,
+)
 from openalexcli.formatters.bibtex import (
     format_bibtex,
+    format_works_bibtex,
     _generate_citation_key,
     _reconstruct_abstract,
     _escape_latex,
 )
-from openalexcli.formatters.json_fmt import format_json
+from openalexcli.formatters.json_fmt import dump_json, format_json, stream_json
+from openalexcli.formatters.table import format_works_table
 
 
 # =============================================================================
@@ -80,6 +97,26 @@ class TestInstitutionIdNormalization:
         assert result == "ror:03vek6s52"
 
 
+# =============================================================================
+# Error Tests
+# =============================================================================
+
+class TestAPIErrors:
+    """Test API error objects."""
+
+    def test_errors_survive_pickling(self):
+        # Exceptions with __slots__ only pickle their fields through __reduce__
+        error = pickle.loads(pickle.dumps(RateLimitError(retry_after=5)))
+        assert isinstance(error, RateLimitError)
+        assert error.retry_after == 5
+        assert error.to_dict()["status_code"] == 429
+
+        error = pickle.loads(pickle.dumps(APIError("Nope", 404, "Check the ID")))
+        assert (error.message, error.status_code, error.suggestion) == (
+            "Nope", 404, "Check the ID"
+        )
+
+
 # =============================================================================
 # Parameter Building Tests
 # =============================================================================
@@ -95,6 +132,24 @@ class TestBuildParams:
     def setup_method(self):
         self.api = OpenAlexAPI()
 
+    def test_search_whitespace_collapsed(self):
+        # Equivalent queries should map to the same request URL
+        params = self.api._build_params(search="  transformer \t attention ")
+        assert params["search"] == "transformer attention"
+
+    def test_work_filters_joined(self):
+        # Typed work filters and a raw filter string share one filter param
+        params = self.api._build_params(
+            filter_str="has_doi:true",
+            extra_filters=OpenAlexAPI._work_filters(
+                from_date="2023-01-01", min_citations=100, open_access=True
+            ),
+        )
+        assert params == {
+            "filter": "has_doi:true,from_publication_date:2023-01-01,"
+            "cited_by_count:>100,is_oa:true"
+        }
+
     def test_normal_search_includes_select(self):
         # Without group_by, select should be included
         params = self.api._build_params(
@@ -161,6 +216,10 @@ class TestBibTexFormatting:
         assert _escape_latex("10% & $5") == r"10\% \& \$5"
         assert _escape_latex("test_name") == r"test\_name"
 
+    def test_latex_escaping_backslash_not_reescaped(self):
+        # The braces emitted for a backslash must not be escaped again
+        assert _escape_latex("a\\b") == r"a\textbackslash{}b"
+
     def test_abstract_reconstruction(self):
         # OpenAlex stores abstracts as inverted index: {word: [positions]}
         inverted_index = {
@@ -175,6 +234,10 @@ class TestBibTexFormatting:
         assert _reconstruct_abstract(None) == ""
         assert _reconstruct_abstract({}) == ""
 
+    def test_abstract_reconstruction_skips_gaps(self):
+        # Missing positions shouldn't leave runs of spaces in the text
+        assert _reconstruct_abstract({"Hello": [0], "world": [3]}) == "Hello world"
+
     def test_full_bibtex_output(self):
         # Test complete BibTeX entry generation
         work = {
@@ -203,6 +266,18 @@ class TestBibTexFormatting:
         assert "doi = 10.1234/test" in bibtex
         assert "pages = 1--10" in bibtex
 
+    def test_null_source_omits_journal(self):
+        # OpenAlex returns null sources for some locations
+        work = {"title": "Test Paper", "primary_location": {"source": None}}
+        bibtex = format_bibtex(work)
+        assert "journal" not in bibtex
+        assert "title = {Test Paper}" in bibtex
+
+    def test_works_export_matches_single_entries(self):
+        works = [{"title": f"Paper {i}", "publication_year": 2000 + i} for i in range(6)]
+        expected = "\n\n".join(format_bibtex(work) for work in works)
+        assert format_works_bibtex(works) == expected
+
 
 # =============================================================================
 # JSON Formatting Tests
@@ -213,7 +288,6 @@ class TestJsonFormatting:
 
     def test_single_result_wrapped(self):
         # Single item should be under 'result' key
-        import json
         output = format_json({"id": "W123"}, pretty=False)
         parsed = json.loads(output)
         assert "result" in parsed
@@ -221,7 +295,6 @@ class TestJsonFormatting:
 
     def test_list_results_wrapped(self):
         # List should be under 'results' key with count
-        import json
         output = format_json([{"id": "W1"}, {"id": "W2"}], pretty=False)
         parsed = json.loads(output)
         assert "results" in parsed
@@ -229,11 +302,61 @@ class TestJsonFormatting:
 
     def test_meta_included(self):
         # Meta should be passed through
-        import json
         output = format_json([], meta={"page": 1, "per_page": 25}, pretty=False)
         parsed = json.loads(output)
         assert parsed["meta"]["page"] == 1
 
+    def test_dump_json_returns_utf8_bytes(self):
+        # Bytes output keeps non-ASCII text unescaped and matches format_json
+        output = dump_json({"title": "Über"}, pretty=False)
+        assert "Über".encode("utf-8") in output
+        assert output.decode("utf-8") == format_json({"title": "Über"}, pretty=False)
+
+    def test_stream_json_matches_envelope(self):
+        # Streaming a generator yields the same document as building it whole
+        results = [{"id": "W1"}, {"id": "W2"}]
+        buf = io.BytesIO()
+        stream_json(iter(results), buf, meta={"page": 1})
+        assert json.loads(buf.getvalue()) == json.loads(
+            dump_json(results, meta={"page": 1}, pretty=False)
+        )
+
+
+# =============================================================================
+# Table Formatting Tests
+# =============================================================================
+
+class TestTableFormatting:
+    """Tests for table output."""
+
+    def test_works_table_rows_and_footer(self):
+        from rich.console import Console
+
+        console = Console(file=io.StringIO(), width=120)
+        works = [{"id": "https://openalex.org/W1", "title": "T", "cited_by_count": 1234}]
+        format_works_table(works, {"count": 5000, "page": 1}, console=console)
+        output = console.file.getvalue()
+        assert "W1" in output
+        assert "1,234" in output
+        assert "Showing 1 of 5,000 results (page 1)" in output
+
+
+# =============================================================================
+# CLI Tests
+# =============================================================================
+
+class TestCLIStartup:
+    """Tests for CLI import cost."""
+
+    def test_importing_cli_defers_http_and_formatters(self):
+        # --help and completion shouldn't pay for httpx or the formatters
+        code = (
+            "import sys, openalexcli.cli; "
+            "print(any(m.startswith(('httpx', 'openalexcli.formatters.')) for m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert result.stdout.strip() == "False"
+
 
 # =============================================================================
 # Integration Tests (with mocked HTTP)
@@ -283,3 +406,349 @@ class TestAPIIntegration:
             assert "select" not in params
             assert params["group_by"] == "publication_year"
             assert params["sort"] == "count:desc"  # Default for group_by
+
+    def test_get_works_bulk_preserves_order(self):
+        """Verify concurrent bulk lookups return works in request order."""
+        api = OpenAlexAPI()
+        requested = []
+
+        def handler(request):
+            work_id = request.url.path.rsplit("/", 1)[-1]
+            requested.append(work_id)
+            return httpx.Response(200, json={"id": f"https://openalex.org/{work_id}"})
+
+        api._aclient = httpx.AsyncClient(
+            base_url=api.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        works = api.get_works_bulk(["W1", "W2", "W3"], concurrency=2)
+
+        assert [w["id"] for w in works] == [
+            "https://openalex.org/W1",
+            "https://openalex.org/W2",
+            "https://openalex.org/W3",
+        ]
+        assert sorted(requested) == ["W1", "W2", "W3"]
+        assert api._aclient is None
+
+    def test_doi_resolution_cached_across_pages(self):
+        """Verify a DOI is resolved to a W-ID only once when paginating."""
+        api = OpenAlexAPI()
+
+        with patch.object(api, '_request') as mock_request:
+            mock_request.side_effect = lambda method, path, params=None: (
+                {"id": "https://openalex.org/W123"}
+                if path.startswith("/works/")
+                else {"results": [], "meta": {"count": 0}}
+            )
+
+            api.get_citations("10.1234/test", page=1)
+            api.get_citations("10.1234/test", page=2)
+
+            paths = [c[0][1] for c in mock_request.call_args_list]
+            assert paths == ["/works/doi:10.1234/test", "/works", "/works"]
+            assert "cites:W123" in mock_request.call_args[0][2]["filter"]
+
+    def test_rate_limit_backoff_is_capped(self):
+        """Verify 429 retries use jittered waits bounded by max_retry_wait."""
+        api = OpenAlexAPI(max_retries=3, max_retry_wait=2)
+        responses = iter([429, 429, 429, 200])
+
+        def handler(request):
+            status = next(responses)
+            return httpx.Response(status, json={"results": []} if status == 200 else {})
+
+        api._client = httpx.Client(
+            base_url=api.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        with patch("openalexcli.api.client.time.sleep") as mock_sleep:
+            assert api._request("GET", "/works") == {"results": []}
+
+        waits = [c[0][0] for c in mock_sleep.call_args_list]
+        assert len(waits) == 3
+        assert all(1.0 <= w <= 2 for w in waits)
+
+    def test_iter_works_follows_cursor(self):
+        """Verify cursor paging requests pages until next_cursor runs out."""
+        api = OpenAlexAPI()
+        pages = {
+            "*": {"results": [{"id": "W1"}], "meta": {"next_cursor": "abc"}},
+            "abc": {"results": [{"id": "W2"}], "meta": {"next_cursor": None}},
+        }
+        cursors = []
+
+        def fake_request(method, path, params=None):
+            cursors.append(params["cursor"])
+            assert params["per_page"] == 200
+            assert "page" not in params
+            return pages[params["cursor"]]
+
+        with patch.object(api, '_request', side_effect=fake_request):
+            results = [w for page in api.iter_works(query="test") for w in page["results"]]
+
+        assert cursors == ["*", "abc"]
+        assert results == [{"id": "W1"}, {"id": "W2"}]
+
+    def test_response_cache_round_trip_and_expiry(self, tmp_path):
+        """Verify ResponseCache stores status and body and honors its TTL."""
+        cache = ResponseCache(tmp_path)
+        url = "https://api.openalex.org/works/W1"
+        assert cache.get(url) is None
+
+        cache.set(url, b'{"id": "W1"}\n', 404)
+        assert cache.get(url) == (404, b'{"id": "W1"}\n')
+
+        cache.ttl = -1
+        assert cache.get(url) is None
+
+    def test_response_cache_deletes_expired_entries(self, tmp_path):
+        """Verify expired entries are removed on lookup and by pruning."""
+        cache = ResponseCache(tmp_path, ttl=100)
+        entity_url = "https://api.openalex.org/works/W1"
+        list_url = "https://api.openalex.org/works?search=test"
+        cache.set(entity_url, b"{}")
+        cache.set(list_url, b"{}")
+        stale = time.time() - 3601
+        for url in (entity_url, list_url):
+            os.utime(cache._path(url), (stale, stale))
+
+        # List endpoints expire after list_ttl even though ttl is longer
+        cache.ttl = 7200
+        assert cache.get(list_url) is None
+        assert not cache._path(list_url).exists()
+        assert cache.get(entity_url) == (200, b"{}")
+
+        cache.ttl = 100
+        assert cache.prune() == 1
+        assert not cache._path(entity_url).exists()
+
+    def test_response_cache_skips_network(self, tmp_path):
+        """Verify cached GET responses are served without hitting the network."""
+        api = OpenAlexAPI(cache_dir=tmp_path)
+        hits = []
+
+        def handler(request):
+            hits.append(request.url)
+            return httpx.Response(200, json={"id": "https://openalex.org/W1"})
+
+        api._client = httpx.Client(
+            base_url=api.BASE_URL,
+            transport=CacheTransport(httpx.MockTransport(handler), api.cache),
+        )
+        first = api.get_work("W1")
+        second = api.get_work("W1")
+
+        assert first == second == {"id": "https://openalex.org/W1"}
+        assert len(hits) == 1
+
+        # Expired entries are refetched
+        api.cache.ttl = -1
+        api.get_work("W1")
+        assert len(hits) == 2
+
+    def test_response_cache_remembers_not_found(self, tmp_path):
+        """Verify 404s are cached so invalid IDs aren't re-queried."""
+        api = OpenAlexAPI(cache_dir=tmp_path)
+        hits = []
+
+        def handler(request):
+            hits.append(request.url)
+            return httpx.Response(404)
+
+        api._client = httpx.Client(
+            base_url=api.BASE_URL,
+            transport=CacheTransport(httpx.MockTransport(handler), api.cache),
+        )
+        for _ in range(2):
+            with pytest.raises(APIError) as exc_info:
+                api.get_work("W404")
+            assert exc_info.value.status_code == 404
+        assert len(hits) == 1
+
+    def test_response_cache_skips_streamed_requests(self, tmp_path):
+        """Verify streamed pages bypass the cache instead of being buffered."""
+        api = OpenAlexAPI(cache_dir=tmp_path)
+        hits = []
+
+        def handler(request):
+            hits.append(request.url)
+            page = {"meta": {"next_cursor": None}, "results": [{"id": "W1"}]}
+            return httpx.Response(200, json=page)
+
+        api._client = httpx.Client(
+            base_url=api.BASE_URL,
+            transport=CacheTransport(httpx.MockTransport(handler), api.cache),
+        )
+        for _ in range(2):
+            assert list(api.iter_results("/works", {})) == [{"id": "W1"}]
+        assert len(hits) == 2
+        assert not any(tmp_path.iterdir())
+
+    def test_iter_results_streams_across_pages(self):
+        """Verify streamed results are yielded per entity across cursor pages."""
+        api = OpenAlexAPI()
+        pages = {
+            "*": {
+                "meta": {"count": 3, "next_cursor": "abc"},
+                "results": [{"id": "W1", "score": 1.5}, {"id": "W2", "authorships": [{}]}],
+            },
+            "abc": {"meta": {"count": 3, "next_cursor": None}, "results": [{"id": "W3"}]},
+        }
+
+        def handler(request):
+            return httpx.Response(200, json=pages[request.url.params["cursor"]])
+
+        api._client = httpx.Client(
+            base_url=api.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        results = list(api.iter_results("/works", {"page": 1}))
+
+        assert results == [
+            {"id": "W1", "score": 1.5},
+            {"id": "W2", "authorships": [{}]},
+            {"id": "W3"},
+        ]
+        assert isinstance(results[0]["score"], float)
+
+    def test_get_all_pages_fetches_rest_concurrently(self):
+        """Verify pages after the first are fetched async and kept in order."""
+        api = OpenAlexAPI()
+
+        def handler(request):
+            # The first page is requested with a cursor, the rest by number
+            page = int(request.url.params.get("page", 1))
+            return httpx.Response(
+                200, json={"meta": {"count": 450}, "results": [{"id": f"W{page}"}]}
+            )
+
+        transport = httpx.MockTransport(handler)
+        api._client = httpx.Client(base_url=api.BASE_URL, transport=transport)
+        api._aclient = httpx.AsyncClient(base_url=api.BASE_URL, transport=transport)
+        pages = list(api.get_all_pages("/works", {"page": 7}, per_page=200, concurrency=2))
+
+        assert [page["results"][0]["id"] for page in pages] == ["W1", "W2", "W3"]
+        assert api._aclient is None
+
+    def test_get_all_pages_follows_cursor_beyond_page_limit(self):
+        """Verify large result sets reuse the first page and stream by cursor."""
+        api = OpenAlexAPI()
+        cursors = []
+
+        def handler(request):
+            cursor = request.url.params["cursor"]
+            cursors.append(cursor)
+            next_cursor = {"*": "abc", "abc": None}[cursor]
+            return httpx.Response(
+                200,
+                json={
+                    "meta": {"count": 20_000, "next_cursor": next_cursor},
+                    "results": [{"id": cursor}],
+                },
+            )
+
+        api._client = httpx.Client(
+            base_url=api.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        pages = api.get_all_pages("/works", {})
+
+        assert next(pages)["results"] == [{"id": "*"}]
+        assert cursors == ["*"]
+        assert [page["results"] for page in pages] == [[{"id": "abc"}]]
+        assert cursors == ["*", "abc"]
+
+    def test_mailto_added_to_outbound_requests(self):
+        """Verify the polite-pool email is appended once to every request."""
+        api = OpenAlexAPI(email="test@example.com")
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.params.get_list("mailto"))
+            return httpx.Response(200, json={"id": "https://openalex.org/W1"})
+
+        api._client = httpx.Client(
+            base_url=api.BASE_URL,
+            transport=httpx.MockTransport(handler),
+            event_hooks={"request": [api._add_mailto]},
+        )
+        api.get_work("W1")
+        api.search_works(query="test")
+
+        assert seen == [["test@example.com"], ["test@example.com"]]
+
+    def test_connection_error_retried(self):
+        """Verify a failed first attempt falls through to the retry loop."""
+        api = OpenAlexAPI(max_retries=2)
+        calls = []
+
+        def handler(request):
+            calls.append(request.url)
+            if len(calls) == 1:
+                raise httpx.ConnectError("boom", request=request)
+            return httpx.Response(200, json={"results": []})
+
+        api._client = httpx.Client(
+            base_url=api.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        with patch("openalexcli.api.client.time.sleep") as mock_sleep:
+            assert api._request("GET", "/works") == {"results": []}
+
+        assert len(calls) == 2
+        mock_sleep.assert_called_once_with(1)
+
+    def test_get_works_by_ids_batches_requests(self):
+        """Verify OpenAlex IDs and DOIs are fetched in batched OR filters."""
+        api = OpenAlexAPI()
+        works = {
+            "W1": {"id": "https://openalex.org/W1", "doi": None},
+            "W2": {"id": "https://openalex.org/W2", "doi": "https://doi.org/10.1/ABC"},
+        }
+
+        def fake_request(method, path, params=None):
+            key, values = params["filter"].split(":", 1)
+            if key == "openalex":
+                results = [works[v] for v in values.split("|") if v in works]
+            else:
+                results = [works["W2"]]
+            return {"results": results[::-1]}
+
+        with patch.object(api, '_request', side_effect=fake_request) as mock_request:
+            results = api.get_works_by_ids(["W2", "10.1/abc", "W1", "W404"])
+
+        assert mock_request.call_count == 2
+        filters = [c[0][2]["filter"] for c in mock_request.call_args_list]
+        assert filters == ["openalex:W2|W1|W404", "doi:10.1/abc"]
+        assert results == [works["W2"], works["W2"], works["W1"]]
+
+    def test_get_works_by_ids_looks_up_other_ids_concurrently(self):
+        """Verify IDs that can't be batched are fetched through the async client."""
+        api = OpenAlexAPI()
+        requested = []
+
+        def handler(request):
+            requested.append(request.url.path)
+            if request.url.path.endswith("pmid:404"):
+                return httpx.Response(404)
+            return httpx.Response(200, json={"id": "https://openalex.org/W9"})
+
+        api._aclient = httpx.AsyncClient(
+            base_url=api.BASE_URL, transport=httpx.MockTransport(handler)
+        )
+        results = api.get_works_by_ids(["pmid:1", "pmid:404"], keep_missing=True)
+
+        assert results == [{"id": "https://openalex.org/W9"}, None]
+        assert sorted(requested) == ["/works/pmid:1", "/works/pmid:404"]
+        assert api._aclient is None
+
+    def test_fetch_works_refetches_only_missing_ids(self):
+        """Verify the CLI only refetches IDs the batched lookup didn't match."""
+        from openalexcli.cli import fetch_works
+
+        api = OpenAlexAPI()
+        batch = [{"id": "W1"}, None, {"id": "W3"}]
+        with (
+            patch.object(api, "get_works_by_ids", return_value=batch),
+            patch.object(api, "get_works_bulk", return_value=[{"id": "W2"}]) as bulk,
+        ):
+            works = fetch_works(api, ["W1", "W2", "W3"])
+
+        assert works == [{"id": "W1"}, {"id": "W2"}, {"id": "W3"}]
+        assert bulk.call_args[0][0] == ["W2"]